@@ -1,87 +1,379 @@
 import abc
+import ast
 import hashlib
 import inspect
 import json
 import logging
 import pickle
+import textwrap
 from collections.abc import Callable
-from typing import Any
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
 
 logger: logging.Logger = logging.getLogger("stickynote.key_strategies")
 
+T = TypeVar("T")
+
+
+# Argument types that are immutable and always encode to the same bytes. Floats
+# are left out since equal values like 0.0 and -0.0 encode differently.
+_SCALAR_TYPES = frozenset({bool, bytes, int, str, type(None)})
+_MAX_ENCODED_ARGUMENTS = 1024
+# Longer strings and bytes aren't worth keeping alive just to skip encoding them
+_MAX_REUSED_ARGUMENT_LENGTH = 256
+
+
+class _CachedSignature:
+    """
+    A function's signature along with the defaults needed to normalize bound
+    arguments without calling `BoundArguments.apply_defaults` on every call.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        self.signature: inspect.Signature = inspect.signature(func)
+        self.names: tuple[str, ...] = tuple(self.signature.parameters)
+        self.defaults: tuple[tuple[str, Any], ...] = tuple(
+            (
+                name,
+                ()
+                if param.kind is inspect.Parameter.VAR_POSITIONAL
+                else {}
+                if param.kind is inspect.Parameter.VAR_KEYWORD
+                else param.default,
+            )
+            for name, param in self.signature.parameters.items()
+        )
+
+        # Functions that only take positional parameters can be bound by zipping
+        # names with positional arguments when called without keyword arguments.
+        parameters = self.signature.parameters.values()
+        self.positional: bool = all(
+            param.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+            for param in parameters
+        )
+        self.required: int = sum(
+            param.default is inspect.Parameter.empty for param in parameters
+        )
+
+        # Encoded arguments and finished keys for positional calls made only with
+        # immutable scalars, which always encode the same way. Only used when no
+        # default could be mutated between calls.
+        self.encoded: dict[tuple[Any, ...], bytes] = {}
+        self.keys: dict[tuple[Any, ...], str] = {}
+        self.reuse_encoded: bool = all(
+            param.kind
+            in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            or param.default is inspect.Parameter.empty
+            or type(param.default) in _SCALAR_TYPES
+            for param in parameters
+        )
+
+    def bind(self, args: Any, kwargs: Any) -> dict[str, Any]:
+        """
+        Bind the arguments to the function's parameters, filling in defaults for
+        any missing arguments.
+        """
+        if (
+            not kwargs
+            and self.positional
+            and self.required <= len(args) <= len(self.defaults)
+        ):
+            arguments = dict(zip(self.names, args, strict=False))
+            arguments.update(self.defaults[len(args) :])
+            return arguments
+
+        arguments = self.signature.bind(*args, **kwargs).arguments
+        if len(arguments) == len(self.defaults):
+            return dict(arguments)
+        return {name: arguments.get(name, default) for name, default in self.defaults}
+
+
+_sig_cache: WeakKeyDictionary[Callable[..., Any], _CachedSignature] = (
+    WeakKeyDictionary()
+)
+_src_hash_cache: WeakKeyDictionary[Callable[..., Any], str] = WeakKeyDictionary()
+
+
+def _get_cached(
+    cache: WeakKeyDictionary[Callable[..., Any], T],
+    func: Callable[..., Any],
+    factory: Callable[[Callable[..., Any]], T],
+) -> T:
+    """
+    Look up a per-function value in `cache`, computing and storing it on a miss.
+    Functions that can't be weakly referenced are computed without caching.
+    """
+    try:
+        return cache[func]
+    except KeyError:
+        pass
+    except TypeError:
+        return factory(func)
+    value = cache[func] = factory(func)
+    return value
+
+
+def _scalar_cache_key(
+    signature: _CachedSignature, args: Any, kwargs: Any
+) -> tuple[Any, ...] | None:
+    """
+    Key under which work derived from a call's arguments can be reused, or `None`
+    if the call isn't made only with positional immutable scalars.
+    """
+    if kwargs or not signature.reuse_encoded or type(args) is not tuple:
+        return None
+    # Types are part of the cache key since equal scalars like 1 and True encode
+    # differently
+    types = tuple(map(type, args))
+    if not _SCALAR_TYPES.issuperset(types):
+        return None
+    for arg in args:
+        if type(arg) in (str, bytes) and len(arg) > _MAX_REUSED_ARGUMENT_LENGTH:
+            return None
+    return (args, types)
+
+
+def _remember(cache: dict[tuple[Any, ...], T], key: tuple[Any, ...], value: T) -> T:
+    if len(cache) >= _MAX_ENCODED_ARGUMENTS:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+# Arguments JSON can't encode are pickled with a fixed protocol, rather than the
+# interpreter's default, which changes between Python versions, so their keys
+# stay the same across upgrades. Protocol 5 is the newest available on every
+# supported version and writes bytearrays directly instead of via `__reduce__`.
+_PICKLE_PROTOCOL = 5
+
+# `json.dumps` builds a new encoder on every call when given options, so share one
+_json_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _new_hasher(data: bytes = b"") -> Any:
+    # Keys only need to be stable and collision-resistant, not cryptographically
+    # strong, so use BLAKE2b with a 128-bit digest, which is faster than SHA-256
+    # for the short inputs keys are usually computed from.
+    return hashlib.blake2b(data, digest_size=16)
+
+
+def _hash_inputs(data: bytes) -> str:
+    return _new_hasher(data).hexdigest()
+
+
+def _hash_source(func: Callable[..., Any]) -> str:
+    source = inspect.getsource(func)
+    try:
+        tree = ast.parse(textwrap.dedent(source))
+    except SyntaxError:
+        # Source lines that aren't complete statements on their own, like a lambda
+        # in the middle of a multi-line call, are hashed as text
+        return _new_hasher(source.encode("utf-8")).hexdigest()
+    # The dumped syntax tree leaves out comments, formatting and line positions,
+    # so only edits to the code itself change the fingerprint
+    return _new_hasher(ast.dump(tree).encode("utf-8")).hexdigest()
+
 
 class MemoKeyStrategy(abc.ABC):
+    # Strategies are consulted on every memoized call, so the built-in ones keep
+    # their state in slots. Subclasses that don't declare slots still get a
+    # `__dict__`.
+    __slots__ = ("__weakref__",)
+
+    # Strategies whose key depends only on the function, not on the arguments it's
+    # called with, can have their contribution to a compound key precomputed.
+    func_invariant: bool = False
+
     @abc.abstractmethod
     def compute(self, func: Callable[..., Any], args: Any, kwargs: Any) -> str: ...
 
+    def update(
+        self, hasher: Any, func: Callable[..., Any], args: Any, kwargs: Any
+    ) -> None:
+        """
+        Feed this strategy's contribution to a compound key into `hasher`.
+
+        Defaults to the encoded result of `compute`. Strategies can override this
+        to feed their raw bytes and skip finalizing a hash of their own.
+        """
+        hasher.update(self.compute(func, args, kwargs).encode())
+
     def __add__(self, other: "MemoKeyStrategy") -> "CompoundMemoKeyStrategy":
         return CompoundMemoKeyStrategy(self, other)
 
 
 class Inputs(MemoKeyStrategy):
-    def compute(self, func: Callable[..., Any], args: Any, kwargs: Any) -> str:
-        # Get the function's signature
-        sig = inspect.signature(func)
+    __slots__ = ()
 
-        # Bind the arguments to the function's parameters
-        bound_args = sig.bind(*args, **kwargs)
-
-        # Apply default values for any missing arguments
-        bound_args.apply_defaults()
-
-        # Convert to a dictionary with parameter names as keys
-        args_dict = dict(bound_args.arguments)
+    def _serialize(self, func: Callable[..., Any], args: Any, kwargs: Any) -> bytes:
+        signature = _get_cached(_sig_cache, func, _CachedSignature)
+        cache_key = _scalar_cache_key(signature, args, kwargs)
+        if cache_key is None:
+            return self._encode(signature.bind(args, kwargs))
+        data = signature.encoded.get(cache_key)
+        if data is None:
+            data = _remember(
+                signature.encoded, cache_key, self._encode(signature.bind(args, kwargs))
+            )
+        return data
 
+    def _encode(self, args_dict: dict[str, Any]) -> bytes:
         try:
             # Use JSON to serialize the dictionary with sort_keys=True for consistency
-            json_str = json.dumps(args_dict, sort_keys=True)
-            sha256 = hashlib.sha256()
-            sha256.update(json_str.encode("utf-8"))
-            return sha256.hexdigest()
+            return _json_encoder.encode(args_dict).encode("utf-8")
         except Exception as e:
             logger.debug(f"Failed to serialize arguments with JSON: {e}")
 
         try:
-            sha256 = hashlib.sha256()
-            sha256.update(pickle.dumps(args_dict))
-            return sha256.hexdigest()
+            return pickle.dumps(args_dict, protocol=_PICKLE_PROTOCOL)
         except Exception as e:
             logger.debug(f"Failed to serialize arguments with pickle: {e}")
 
         raise ValueError("Failed to serialize arguments")
 
+    def compute(self, func: Callable[..., Any], args: Any, kwargs: Any) -> str:
+        return _hash_inputs(self._serialize(func, args, kwargs))
+
+    def update(
+        self, hasher: Any, func: Callable[..., Any], args: Any, kwargs: Any
+    ) -> None:
+        # Subclasses that compute keys differently contribute their own keys
+        if type(self).compute is not Inputs.compute:
+            super().update(hasher, func, args, kwargs)
+            return
+        # JSON documents and pickles are self-delimiting, so the serialized
+        # arguments can be fed to a compound hasher without hashing them first.
+        hasher.update(self._serialize(func, args, kwargs))
+
 
 class SourceCode(MemoKeyStrategy):
+    __slots__ = ()
+
+    func_invariant = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses that compute keys differently may depend on the arguments
+        if "compute" in cls.__dict__ and "func_invariant" not in cls.__dict__:
+            cls.func_invariant = False
+
     def compute(  # ty: ignore[invalid-method-override]
         self, func: Callable[..., Any], _args: Any, _kwargs: Any
     ) -> str:
-        sha256 = hashlib.sha256()
-        sha256.update(inspect.getsource(func).encode("utf-8"))
-        return sha256.hexdigest()
+        return _get_cached(_src_hash_cache, func, _hash_source)
 
 
 class CompoundMemoKeyStrategy(MemoKeyStrategy):
+    __slots__ = (
+        "_call_strategies",
+        "_invariant_strategies",
+        "_prepared",
+        "_reuse_keys",
+        "func_invariant",
+        "strategies",
+    )
+
     def __init__(self, *strategies: MemoKeyStrategy):
-        self.strategies: tuple[MemoKeyStrategy, ...] = tuple(
-            s
-            for strategy in strategies
-            for s in (
-                strategy.strategies
-                if isinstance(strategy, CompoundMemoKeyStrategy)
-                else [strategy]
+        self._set_strategies(
+            tuple(
+                s
+                for strategy in strategies
+                for s in (
+                    strategy.strategies
+                    if isinstance(strategy, CompoundMemoKeyStrategy)
+                    else [strategy]
+                )
             )
         )
 
+    @classmethod
+    def _from_flat(
+        cls, strategies: tuple[MemoKeyStrategy, ...]
+    ) -> "CompoundMemoKeyStrategy":
+        """
+        Build a compound strategy from strategies that are already flattened.
+        """
+        compound = cls.__new__(cls)
+        compound._set_strategies(strategies)
+        return compound
+
+    def _set_strategies(self, strategies: tuple[MemoKeyStrategy, ...]) -> None:
+        self.strategies: tuple[MemoKeyStrategy, ...] = strategies
+
+        # Leading function-invariant strategies are folded into a per-function
+        # hash state once; only the remaining strategies are computed per call.
+        split = 0
+        while split < len(self.strategies) and self.strategies[split].func_invariant:
+            split += 1
+        self._invariant_strategies = self.strategies[:split]
+        self._call_strategies = self.strategies[split:]
+        self.func_invariant = not self._call_strategies
+        # Keys that only depend on plain `Inputs` beyond the per-function prefix
+        # can be reused for repeated calls with the same scalar arguments.
+        self._reuse_keys = bool(self._call_strategies) and all(
+            type(strategy) is Inputs for strategy in self._call_strategies
+        )
+        self._prepared: WeakKeyDictionary[Callable[..., Any], Any] = WeakKeyDictionary()
+
+    def __getstate__(self) -> Any:
+        # Prepared hasher states can't be pickled, so only the strategies (and the
+        # instance dict of subclasses that have one) are kept; the rest is rebuilt
+        return self.strategies, getattr(self, "__dict__", None)
+
+    def __setstate__(self, state: Any) -> None:
+        strategies, instance_dict = state
+        self._set_strategies(strategies)
+        if instance_dict:
+            self.__dict__.update(instance_dict)
+
+    def _prepare(self, func: Callable[..., Any]) -> Any:
+        hasher = _new_hasher()
+        for strategy in self._invariant_strategies:
+            strategy.update(hasher, func, (), {})
+        return hasher
+
     def compute(self, func: Callable[..., Any], args: Any, kwargs: Any) -> str:
-        sha256 = hashlib.sha256()
+        if not self._reuse_keys:
+            return self._compute(func, args, kwargs)
+        signature = _get_cached(_sig_cache, func, _CachedSignature)
+        cache_key = _scalar_cache_key(signature, args, kwargs)
+        if cache_key is None:
+            return self._compute(func, args, kwargs)
+        cache_key = (self, *cache_key)
+        key = signature.keys.get(cache_key)
+        if key is None:
+            key = _remember(
+                signature.keys, cache_key, self._compute(func, args, kwargs)
+            )
+        return key
+
+    def _compute(self, func: Callable[..., Any], args: Any, kwargs: Any) -> str:
+        if self._invariant_strategies:
+            hasher = _get_cached(self._prepared, func, self._prepare).copy()
+        else:
+            hasher = _new_hasher()
+        for strategy in self._call_strategies:
+            strategy.update(hasher, func, args, kwargs)
+        return hasher.hexdigest()
+
+    def update(
+        self, hasher: Any, func: Callable[..., Any], args: Any, kwargs: Any
+    ) -> None:
         for strategy in self.strategies:
-            sha256.update(strategy.compute(func, args, kwargs).encode())
-        return sha256.hexdigest()
+            strategy.update(hasher, func, args, kwargs)
 
     def __add__(self, other: MemoKeyStrategy) -> "CompoundMemoKeyStrategy":
+        # Both operands are already flat, so their strategies can be concatenated
+        # without re-flattening.
         if isinstance(other, CompoundMemoKeyStrategy):
-            return CompoundMemoKeyStrategy(*self.strategies, *other.strategies)
-        return CompoundMemoKeyStrategy(*self.strategies, other)
+            return CompoundMemoKeyStrategy._from_flat(
+                self.strategies + other.strategies
+            )
+        return CompoundMemoKeyStrategy._from_flat((*self.strategies, other))
 
 
 DEFAULT_STRATEGY = SourceCode() + Inputs()
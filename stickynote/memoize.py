@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime, timedelta, timezone
 from functools import partial, update_wrapper
 from typing import (
-    TYPE_CHECKING,
     Any,
     Generic,
     Literal,
@@ -20,9 +20,15 @@ from exceptiongroup import ExceptionGroup
 from typing_extensions import ParamSpec, Self
 
 from stickynote.key_strategies import DEFAULT_STRATEGY, MemoKeyStrategy
-from stickynote.serializers import DEFAULT_SERIALIZER_CHAIN, Serializer
-from stickynote.storage import DEFAULT_STORAGE, MemoStorage
-from stickynote.storage.base import ExpiredMemoError
+from stickynote.serializers import DEFAULT_SERIALIZER_CHAIN, Serializer, serializer_for
+from stickynote.storage import DEFAULT_STORAGE, MemoStorage, TieredStorage
+from stickynote.storage.base import (
+    MISSING,
+    _get_many,
+    _get_or_miss,
+    _get_or_miss_async,
+    _set_many,
+)
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -48,89 +54,237 @@ class OnCacheHitCallback(Protocol, Generic[R_co]):
     ) -> None: ...
 
 
+# `MemoizedCallable` attributes that its specialized implementation is built from
+_SPECIALIZED_ATTRIBUTES = frozenset(
+    {"fn", "key_strategy", "max_age", "serializer", "storage"}
+)
+
+
 class MemoizedCallable(Generic[P, R]):
     """Protocol for memoized callables."""
 
+    # Slots for the attributes read on every call. `__dict__` stays for the
+    # attributes `update_wrapper` copies over from the wrapped function.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_call",
+        "_inflight",
+        "_is_async",
+        "_serializers",
+        "before_cache_lookup_callbacks",
+        "fn",
+        "key_strategy",
+        "max_age",
+        "on_cache_hit_callbacks",
+        "serializer",
+        "storage",
+    )
+
     def __init__(
         self,
         fn: Callable[P, R],
         storage: MemoStorage,
-        serializer: Serializer | Iterable[Serializer],
+        serializer: Serializer | Iterable[Serializer] | None,
         key_strategy: MemoKeyStrategy,
         max_age: timedelta | None = None,
+        l1_size: int | None = None,
     ):
         self.fn = fn
         update_wrapper(self, fn)
-        self.storage = storage
+        if serializer is None:
+            serializer = serializer_for(storage)
+        self.storage: MemoStorage = (
+            TieredStorage(storage, maxsize=l1_size) if l1_size else storage
+        )
         self.serializer = serializer
+        self._serializers: tuple[Serializer, ...] = _normalize_serializers(serializer)
         self.key_strategy = key_strategy
         self.max_age = max_age
         self.on_cache_hit_callbacks: list[OnCacheHitCallback[R]] = []
         self.before_cache_lookup_callbacks: list[BeforeCacheLookupCallback] = []
+        self._is_async: bool = inspect.iscoroutinefunction(fn)
+        # Lookups in progress for async calls, so concurrent calls with the same
+        # key share one storage round trip and function call
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._call: Callable[P, R] = self._specialize()
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        if inspect.iscoroutinefunction(self.fn):
-            return self._call_async(*args, **kwargs)  # ty: ignore[invalid-return-type]
+        # Callbacks can also be registered by appending to the public lists, so
+        # check for them on every call rather than when specializing
+        if self.on_cache_hit_callbacks or self.before_cache_lookup_callbacks:
+            if self._is_async:
+                return self._call_async(*args, **kwargs)  # ty: ignore[invalid-return-type]
+            return self._call_sync(*args, **kwargs)
+        return self._call(*args, **kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # The specialized implementation closes over its configuration, so it is
+        # rebuilt when the configuration changes after construction
+        if name in _SPECIALIZED_ATTRIBUTES and hasattr(self, "_call"):
+            self._serializers = _normalize_serializers(self.serializer)
+            self._is_async = inspect.iscoroutinefunction(self.fn)
+            self._call = self._specialize()
+
+    def __getstate__(self) -> Any:
+        # The specialized implementation and in-flight lookups are rebuilt on load
+        # rather than pickled
+        return self.__dict__, {
+            name: getattr(self, name)
+            for name in (
+                *_SPECIALIZED_ATTRIBUTES,
+                "before_cache_lookup_callbacks",
+                "on_cache_hit_callbacks",
+            )
+        }
+
+    def __setstate__(self, state: Any) -> None:
+        instance_dict, configuration = state
+        self.__dict__.update(instance_dict)
+        # `_call` isn't set yet, so these don't each re-specialize
+        for name, value in configuration.items():
+            setattr(self, name, value)
+        self._serializers = _normalize_serializers(self.serializer)
+        self._is_async = inspect.iscoroutinefunction(self.fn)
+        self._inflight = {}
+        self._call = self._specialize()
+
+    def _specialize(self) -> Callable[P, R]:
+        """
+        Build the implementation used by `__call__` for functions without
+        registered callbacks, closing over the configuration so the callback
+        handling and attribute lookups are compiled out.
+        """
+        if self._is_async:
+            return _make_async_call(  # ty: ignore[invalid-return-type]
+                self.fn,  # ty: ignore[invalid-argument-type]
+                self.storage,
+                self._serializers,
+                self.key_strategy,
+                self.max_age,
+                self._inflight,
+            )
+        return _make_sync_call(
+            self.fn, self.storage, self._serializers, self.key_strategy, self.max_age
+        )
+
+    def _call_sync(self, *args: P.args, **kwargs: P.kwargs) -> R:
         key = self.key_strategy.compute(self.fn, args, kwargs)
-        for callback in self.before_cache_lookup_callbacks:
-            callback(key, args, kwargs)
-        with MemoBlock(
-            key=key,
-            storage=self.storage,
-            serializer=self.serializer,
-            max_age=self.max_age,
-        ) as memo:
-            if memo.hit:
-                for callback in self.on_cache_hit_callbacks:
-                    try:
-                        callback(
-                            key,
-                            memo.value,
-                            args,
-                            kwargs,
-                            datetime.now(timezone.utc),
-                        )
-                    except Exception:
-                        logger.warning(
-                            "An error occurred while calling on_cache_hit callback",
-                            exc_info=True,
-                        )
-                return memo.value
-            result = self.fn(*args, **kwargs)
-            memo.stage(result)
-            return result
+        if self.before_cache_lookup_callbacks:
+            for callback in self.before_cache_lookup_callbacks:
+                callback(key, args, kwargs)
+        hit, value = _load(self.storage, self._serializers, key, self.max_age)
+        if hit:
+            if self.on_cache_hit_callbacks:
+                self._notify_cache_hit(key, value, args, kwargs)
+            return value
+        result = self.fn(*args, **kwargs)
+        _save(self.storage, self._serializers, key, result)
+        return result
 
     async def _call_async(self, *args: P.args, **kwargs: P.kwargs) -> R:
         key = self.key_strategy.compute(self.fn, args, kwargs)
-        for callback in self.before_cache_lookup_callbacks:
-            callback(key, args, kwargs)
-        async with AsyncMemoBlock(
-            key=key,
-            storage=self.storage,
-            serializer=self.serializer,
-            max_age=self.max_age,
-        ) as memo:
-            if memo.hit:
-                for callback in self.on_cache_hit_callbacks:
-                    try:
-                        callback(
-                            key,
-                            memo.value,
-                            args,
-                            kwargs,
-                            datetime.now(timezone.utc),
-                        )
-                    except Exception:
-                        logger.warning(
-                            "An error occurred while calling on_cache_hit callback",
-                            exc_info=True,
-                        )
-                return memo.value
-            if TYPE_CHECKING:
-                assert inspect.iscoroutinefunction(self.fn)  # pragma: no cover
-            result = await self.fn(*args, **kwargs)
-            memo.stage(result)
-            return result
+        if self.before_cache_lookup_callbacks:
+            for callback in self.before_cache_lookup_callbacks:
+                callback(key, args, kwargs)
+        hit, value = await _coalesce(
+            self._inflight, self._serializers, self._resolve_async, key, args, kwargs
+        )
+        if hit and self.on_cache_hit_callbacks:
+            self._notify_cache_hit(key, value, args, kwargs)
+        return value
+
+    async def _resolve_async(
+        self, key: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[bool, Any, str | None]:
+        return await _resolve_async(
+            self.fn,  # ty: ignore[invalid-argument-type]
+            self.storage,
+            self._serializers,
+            self.max_age,
+            key,
+            args,
+            kwargs,
+        )
+
+    def map(self, *iterables: Iterable[Any]) -> list[R]:
+        """
+        Call the memoized function once for each set of positional arguments drawn
+        from `iterables`, like the built-in `map`.
+
+        Memos for every call are looked up with a single `get_many` storage call,
+        and new results are saved with a single `set_many` call, so only the misses
+        pay for a call to the underlying function. Storages that support batching,
+        like `MemoryStorage` and `RedisStorage`, serve each in one round trip.
+
+        Args:
+            iterables: Iterables providing the positional arguments for each call.
+        """
+        if self._is_async:
+            raise TypeError("map is not supported for async functions")
+
+        fn: Callable[..., R] = self.fn
+        calls: list[tuple[Any, ...]] = list(zip(*iterables, strict=False))
+        empty: dict[str, Any] = {}
+        keys = [self.key_strategy.compute(fn, args, empty) for args in calls]
+        if self.before_cache_lookup_callbacks:
+            for key, args in zip(keys, calls, strict=True):
+                for callback in self.before_cache_lookup_callbacks:
+                    callback(key, args, empty)
+
+        max_age = self.max_age
+        created_after = datetime.now(_UTC) - max_age if max_age else None
+        native = getattr(self.storage, "native", False)
+        results: list[R] = []
+        computed: dict[str, R] = {}
+        for key, args, data in zip(
+            keys,
+            calls,
+            _get_many(self.storage, keys, created_after=created_after),
+            strict=True,
+        ):
+            if data is not MISSING:
+                value = (
+                    cast(R, data) if native else _deserialize(self._serializers, data)
+                )
+                if self.on_cache_hit_callbacks:
+                    self._notify_cache_hit(key, value, args, empty)
+            elif key in computed:
+                value = computed[key]
+            else:
+                value = computed[key] = fn(*args)
+            results.append(value)
+
+        if computed:
+            _set_many(
+                self.storage,
+                cast("dict[str, str]", computed)
+                if native
+                else {
+                    key: _serialize(self._serializers, value)
+                    for key, value in computed.items()
+                },
+            )
+        return results
+
+    def _notify_cache_hit(
+        self,
+        key: str,
+        value: R,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # Read the clock once per hit, and only when a callback will receive it
+        timestamp = datetime.now(_UTC)
+        for callback in self.on_cache_hit_callbacks:
+            try:
+                callback(key, value, args, kwargs, timestamp)
+            except Exception:
+                logger.warning(
+                    "An error occurred while calling on_cache_hit callback",
+                    exc_info=True,
+                )
 
     def before_cache_lookup(self, fn: BeforeCacheLookupCallback) -> None:
         self.before_cache_lookup_callbacks.append(fn)
@@ -142,6 +296,158 @@ class MemoizedCallable(Generic[P, R]):
         self.on_cache_hit_callbacks.append(fn)
 
 
+def _make_sync_call(
+    fn: Callable[P, R],
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key_strategy: MemoKeyStrategy,
+    max_age: timedelta | None,
+) -> Callable[P, R]:
+    """
+    Build a call implementation for a synchronous memoized function with no
+    callbacks, closing over its configuration so the hot path only touches locals.
+    """
+    if getattr(storage, "native", False) and max_age is None:
+        # Native storage without an age limit needs no deserialization or cutoff,
+        # so a hit is a key computation and a single storage lookup.
+        compute = key_strategy.compute
+        get_or_miss = getattr(storage, "get_or_miss", None) or partial(
+            _get_or_miss, storage
+        )
+        set_value = storage.set
+
+        def native_call(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = compute(fn, args, kwargs)
+            value = get_or_miss(key)
+            if value is not MISSING:
+                return value  # ty: ignore[invalid-return-type]
+            result = fn(*args, **kwargs)
+            set_value(key, result)  # ty: ignore[invalid-argument-type]
+            return result
+
+        return native_call
+
+    def call(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = key_strategy.compute(fn, args, kwargs)
+        hit, value = _load(storage, serializers, key, max_age)
+        if hit:
+            return value
+        result = fn(*args, **kwargs)
+        _save(storage, serializers, key, result)
+        return result
+
+    return call
+
+
+def _make_async_call(
+    fn: Callable[P, Awaitable[R]],
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key_strategy: MemoKeyStrategy,
+    max_age: timedelta | None,
+    inflight: dict[str, asyncio.Future[Any]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Build a call implementation for an asynchronous memoized function with no
+    callbacks, closing over its configuration so the hot path only touches locals.
+    """
+
+    async def resolve(
+        key: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[bool, Any, str | None]:
+        return await _resolve_async(
+            fn, storage, serializers, max_age, key, args, kwargs
+        )
+
+    async def call(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = key_strategy.compute(fn, args, kwargs)
+        _, value = await _coalesce(inflight, serializers, resolve, key, args, kwargs)
+        return value
+
+    return call
+
+
+async def _resolve_async(
+    fn: Callable[..., Awaitable[Any]],
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    max_age: timedelta | None,
+    key: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[bool, Any, str | None]:
+    """
+    Load the memo for an async call, calling the function and saving its result on
+    a miss.
+
+    Returns:
+        A `(hit, value, data)` tuple. `data` is the serialized value, or `None`
+        for native storage.
+    """
+    native = getattr(storage, "native", False)
+    created_after = datetime.now(_UTC) - max_age if max_age else None
+    data = await _get_or_miss_async(storage, key, created_after=created_after)
+    if data is not MISSING:
+        if native:
+            return True, data, None
+        return True, _deserialize(serializers, data), data
+    result = await fn(*args, **kwargs)
+    if native:
+        await storage.set_async(key, result)
+        return False, result, None
+    data = _serialize(serializers, result)
+    await storage.set_async(key, data)
+    return False, result, data
+
+
+async def _coalesce(
+    inflight: dict[str, asyncio.Future[Any]],
+    serializers: tuple[Serializer, ...],
+    resolve: Callable[
+        [str, tuple[Any, ...], dict[str, Any]],
+        Awaitable[tuple[bool, Any, str | None]],
+    ],
+    key: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[bool, Any]:
+    """
+    Resolve a memoized call, sharing the outcome with concurrent calls for the same
+    key instead of having each of them look up the memo and call the function.
+
+    If the call doing the work fails or is cancelled, the calls that were waiting
+    on it each resolve the key themselves, concurrently, so errors are never handed
+    to callers that didn't raise them and failures aren't retried one at a time.
+    Unless the storage is native, waiting calls deserialize their own copy of the
+    value, so callers never share a mutable result.
+
+    Returns:
+        A `(hit, value)` tuple.
+    """
+    loop = asyncio.get_running_loop()
+    pending = inflight.get(key)
+    if pending is not None and pending.get_loop() is loop:
+        # Shielded so a cancelled waiter doesn't cancel the lookup for the others
+        outcome = await asyncio.shield(pending)
+        if outcome is _UNSET:
+            return (await resolve(key, args, kwargs))[:2]
+        hit, value, data = outcome
+        if data is not None:
+            value = _deserialize(serializers, data)
+        return hit, value
+
+    future: asyncio.Future[Any] = loop.create_future()
+    inflight[key] = future
+    outcome = _UNSET
+    try:
+        outcome = await resolve(key, args, kwargs)
+        return outcome[:2]
+    finally:
+        if inflight.get(key) is future:
+            del inflight[key]
+        future.set_result(outcome)
+
+
 @overload
 def memoize(
     __fn: Callable[P, R],
@@ -154,8 +460,9 @@ def memoize(
     *,
     storage: MemoStorage = DEFAULT_STORAGE,
     key_strategy: MemoKeyStrategy = DEFAULT_STRATEGY,
-    serializer: Serializer | Iterable[Serializer] = DEFAULT_SERIALIZER_CHAIN,
+    serializer: Serializer | Iterable[Serializer] | None = None,
     max_age: timedelta | None = None,
+    l1_size: int | None = None,
 ) -> Callable[[Callable[P, R]], MemoizedCallable[P, R]]: ...
 
 
@@ -164,8 +471,9 @@ def memoize(
     *,
     storage: MemoStorage = DEFAULT_STORAGE,
     key_strategy: MemoKeyStrategy = DEFAULT_STRATEGY,
-    serializer: Serializer | Iterable[Serializer] = DEFAULT_SERIALIZER_CHAIN,
+    serializer: Serializer | Iterable[Serializer] | None = None,
     max_age: timedelta | None = None,
+    l1_size: int | None = None,
 ) -> (
     MemoizedCallable[P, R]
     | Callable[
@@ -179,34 +487,184 @@ def memoize(
     Args:
         storage: A `Storage` object to use to store memoized results.
         key_strategy: The key strategy to use for memoization.
-        serializer: The serializer to use for memoization.
+        serializer: The serializer to use for memoization. Defaults to a
+            serializer chain suited to the storage.
         max_age: The maximum age of the cached result.
+        l1_size: If set, keep up to this many recently used memos in process in
+            front of `storage`, skipping its I/O for hot keys. The in-process tier
+            is part of the memoized callable's `storage`, so assigning a new
+            `storage` after decoration replaces it too; assign a `TieredStorage`
+            to keep one.
     """
 
     if __fn is None:
-        return cast(
-            Callable[
-                [Callable[P, R]],
-                MemoizedCallable[P, R],
-            ],
-            partial(
-                memoize,
+
+        def decorator(fn: Callable[P, R]) -> MemoizedCallable[P, R]:
+            return MemoizedCallable(
+                fn,
                 storage=storage,
-                key_strategy=key_strategy,
                 serializer=serializer,
+                key_strategy=key_strategy,
                 max_age=max_age,
-            ),
-        )
+                l1_size=l1_size,
+            )
+
+        return decorator
     return MemoizedCallable(
         __fn,
         storage=storage,
         serializer=serializer,
         key_strategy=key_strategy,
         max_age=max_age,
+        l1_size=l1_size,
     )
 
 
 _UNSET = object()
+_UTC = timezone.utc
+
+
+def _normalize_serializers(
+    serializer: Serializer | Iterable[Serializer],
+) -> tuple[Serializer, ...]:
+    if isinstance(serializer, tuple):
+        return serializer
+    if isinstance(serializer, Serializer):
+        return (serializer,)
+    return tuple(serializer)
+
+
+def _serialize(serializers: tuple[Serializer, ...], value: Any) -> str:
+    """
+    Serialize a value with the first serializer in the chain that succeeds.
+    """
+    if len(serializers) == 1:
+        try:
+            return serializers[0].serialize(value)
+        except Exception as e:
+            raise ExceptionGroup(
+                "All serializers failed to serialize the result.", [e]
+            ) from None
+
+    # Only allocated once a serializer fails
+    serializer_exceptions: list[Exception] | None = None
+    for serializer in serializers:
+        try:
+            return serializer.serialize(value)
+        except Exception as e:
+            if serializer_exceptions is None:
+                serializer_exceptions = []
+            serializer_exceptions.append(e)
+    raise ExceptionGroup(
+        "All serializers failed to serialize the result.", serializer_exceptions or []
+    )
+
+
+def _deserialize(serializers: tuple[Serializer, ...], data: str) -> Any:
+    """
+    Deserialize data with the first serializer in the chain that succeeds.
+    """
+    if len(serializers) == 1:
+        try:
+            return serializers[0].deserialize(data)
+        except Exception as e:
+            raise ExceptionGroup(
+                "All serializers failed to deserialize the result.", [e]
+            ) from None
+
+    # Only allocated once a serializer fails
+    serializer_exceptions: list[Exception] | None = None
+    for serializer in serializers:
+        try:
+            return serializer.deserialize(data)
+        except Exception as e:
+            if serializer_exceptions is None:
+                serializer_exceptions = []
+            serializer_exceptions.append(e)
+    raise ExceptionGroup(
+        "All serializers failed to deserialize the result.",
+        serializer_exceptions or [],
+    )
+
+
+def _load(
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key: str,
+    max_age: timedelta | None,
+) -> tuple[bool, Any]:
+    """
+    Load and deserialize a memoized value from storage.
+
+    Returns:
+        A `(hit, value)` tuple. `value` is `None` on a miss.
+    """
+    created_after = datetime.now(_UTC) - max_age if max_age else None
+    data = _get_or_miss(
+        storage,
+        key,
+        created_after=created_after,
+    )
+    if data is MISSING:
+        return False, None
+    if getattr(storage, "native", False):
+        return True, data
+
+    return True, _deserialize(serializers, data)
+
+
+async def _load_async(
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key: str,
+    max_age: timedelta | None,
+) -> tuple[bool, Any]:
+    """
+    Load and deserialize a memoized value from storage.
+
+    Returns:
+        A `(hit, value)` tuple. `value` is `None` on a miss.
+    """
+    created_after = datetime.now(_UTC) - max_age if max_age else None
+    data = await _get_or_miss_async(
+        storage,
+        key,
+        created_after=created_after,
+    )
+    if data is MISSING:
+        return False, None
+    if getattr(storage, "native", False):
+        return True, data
+
+    return True, _deserialize(serializers, data)
+
+
+def _save(
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key: str,
+    value: Any,
+) -> None:
+    """
+    Serialize a value and save it to storage.
+    """
+    if not getattr(storage, "native", False):
+        value = _serialize(serializers, value)
+    storage.set(key, value)
+
+
+async def _save_async(
+    storage: MemoStorage,
+    serializers: tuple[Serializer, ...],
+    key: str,
+    value: Any,
+) -> None:
+    """
+    Serialize a value and save it to storage.
+    """
+    if not getattr(storage, "native", False):
+        value = _serialize(serializers, value)
+    await storage.set_async(key, value)
 
 
 class BaseMemoBlock:
@@ -214,6 +672,16 @@ class BaseMemoBlock:
     Base class for memoization blocks.
     """
 
+    __slots__ = (
+        "hit",
+        "key",
+        "max_age",
+        "serializer",
+        "staged_value",
+        "storage",
+        "value",
+    )
+
     def __init__(
         self,
         key: str,
@@ -227,10 +695,7 @@ class BaseMemoBlock:
 
         self.hit: bool = False
         self.value: Any = None
-        if isinstance(serializer, Serializer):
-            self.serializer: tuple[Serializer, ...] = (serializer,)
-        else:
-            self.serializer: tuple[Serializer, ...] = tuple(serializer)
+        self.serializer: tuple[Serializer, ...] = _normalize_serializers(serializer)
 
         self.staged_value: Any = _UNSET
 
@@ -246,11 +711,16 @@ class MemoBlock(BaseMemoBlock):
     Context manager to load and save the result of a function to a backend.
     """
 
+    __slots__ = ()
+
     def __enter__(self) -> Self:
         self.load()
         return self
 
     def __exit__(self, *args: Any) -> None:
+        # Blocks that were hits or never staged a value have nothing to save
+        if self.staged_value is _UNSET:
+            return
         self.save()
 
         self.staged_value = _UNSET
@@ -259,33 +729,10 @@ class MemoBlock(BaseMemoBlock):
         """
         Load the result of a function from the backend.
         """
-        serializer_exceptions: list[Exception] = []
-        if self.storage.exists(self.key):
-            for serializer in self.serializer:
-                try:
-                    created_after = (
-                        datetime.now(timezone.utc) - self.max_age
-                        if self.max_age
-                        else None
-                    )
-                    self.value: Any = serializer.deserialize(
-                        self.storage.get(
-                            key=self.key,
-                            created_after=created_after,  # ty: ignore[invalid-argument-type]
-                        )
-                    )
-                    self.hit = True
-                    break
-                except ExpiredMemoError:
-                    break
-                except Exception as e:
-                    serializer_exceptions.append(e)
-
-        if len(serializer_exceptions) == len(self.serializer):
-            raise ExceptionGroup(
-                "All serializers failed to deserialize the result.",
-                serializer_exceptions,
-            )
+        hit, value = _load(self.storage, self.serializer, self.key, self.max_age)
+        if hit:
+            self.hit = True
+            self.value: Any = value
 
     def save(self) -> None:
         """
@@ -294,21 +741,7 @@ class MemoBlock(BaseMemoBlock):
         if self.staged_value is _UNSET:
             return
 
-        serializer_exceptions: list[Exception] = []
-        serialized_value = _UNSET
-        for serializer in self.serializer:
-            try:
-                serialized_value = serializer.serialize(self.staged_value)
-                break
-            except Exception as e:
-                serializer_exceptions.append(e)
-
-        if not isinstance(serialized_value, str):
-            raise ExceptionGroup(
-                "All serializers failed to serialize the result.", serializer_exceptions
-            )
-
-        self.storage.set(self.key, serialized_value)
+        _save(self.storage, self.serializer, self.key, self.staged_value)
 
 
 class AsyncMemoBlock(BaseMemoBlock):
@@ -316,44 +749,27 @@ class AsyncMemoBlock(BaseMemoBlock):
     Context manager to load and save the result of a function to a backend.
     """
 
+    __slots__ = ()
+
     async def __aenter__(self) -> Self:
         await self.load()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        await self.save()
+        # Blocks that were hits or never staged a value have nothing to save
+        if self.staged_value is not _UNSET:
+            await self.save()
 
     async def load(self) -> None:
         """
         Load the result of a function from the backend.
         """
-        serializer_exceptions: list[Exception] = []
-        if await self.storage.exists_async(self.key):
-            for serializer in self.serializer:
-                try:
-                    created_after = (
-                        datetime.now(timezone.utc) - self.max_age
-                        if self.max_age
-                        else None
-                    )
-                    self.value: Any = serializer.deserialize(
-                        await self.storage.get_async(
-                            key=self.key,
-                            created_after=created_after,  # ty: ignore[invalid-argument-type]
-                        )
-                    )
-                    self.hit = True
-                    break
-                except ExpiredMemoError:
-                    break
-                except Exception as e:
-                    serializer_exceptions.append(e)
-
-        if len(serializer_exceptions) == len(self.serializer):
-            raise ExceptionGroup(
-                "All serializers failed to deserialize the result.",
-                serializer_exceptions,
-            )
+        hit, value = await _load_async(
+            self.storage, self.serializer, self.key, self.max_age
+        )
+        if hit:
+            self.hit = True
+            self.value: Any = value
 
     async def save(self) -> None:
         """
@@ -362,18 +778,4 @@ class AsyncMemoBlock(BaseMemoBlock):
         if self.staged_value is _UNSET:
             return
 
-        serializer_exceptions: list[Exception] = []
-        serialized_value = _UNSET
-        for serializer in self.serializer:
-            try:
-                serialized_value = serializer.serialize(self.staged_value)
-                break
-            except Exception as e:
-                serializer_exceptions.append(e)
-
-        if not isinstance(serialized_value, str):
-            raise ExceptionGroup(
-                "All serializers failed to serialize the result.", serializer_exceptions
-            )
-
-        await self.storage.set_async(self.key, serialized_value)
+        await _save_async(self.storage, self.serializer, self.key, self.staged_value)
@@ -5,6 +5,7 @@ import hashlib
 import inspect
 import json
 import logging
+import pickle
 import sys
 from collections.abc import Callable, Iterable
 from contextvars import ContextVar
@@ -13,7 +14,6 @@ from typing import Any
 
 from exceptiongroup import ExceptionGroup
 
-from stickynote.key_strategies import Inputs
 from stickynote.serializers import DEFAULT_SERIALIZER_CHAIN, Serializer
 from stickynote.storage import DEFAULT_STORAGE, MemoStorage
 from stickynote.storage.base import MissingMemoError
@@ -21,6 +21,31 @@ from stickynote.storage.base import MissingMemoError
 logger: logging.Logger = logging.getLogger("stickynote.replay")
 
 
+def _hash_arguments(func: Callable[..., Any], args: Any, kwargs: Any) -> str:
+    """
+    Hash a call's arguments for a replay key.
+
+    Recorded sessions are resumed across processes and library versions, so this
+    keeps its own stable encoding and digest instead of following the
+    `Inputs` key strategy, whose keys only need to be stable within a cache.
+    The pickle fallback is pinned to protocol 4, the default up to Python 3.13,
+    so hashes of recorded calls don't change with the interpreter's default.
+    """
+    bound_args = inspect.signature(func).bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    args_dict = dict(bound_args.arguments)
+    try:
+        data = json.dumps(args_dict, sort_keys=True).encode("utf-8")
+    except Exception as e:
+        logger.debug(f"Failed to serialize arguments with JSON: {e}")
+        try:
+            data = pickle.dumps(args_dict, protocol=4)
+        except Exception as e:
+            logger.debug(f"Failed to serialize arguments with pickle: {e}")
+            raise ValueError("Failed to serialize arguments") from None
+    return hashlib.sha256(data).hexdigest()
+
+
 class SuspendExecution(BaseException):
     """Raised by a wrapped function to signal that execution should pause.
 
@@ -91,7 +116,6 @@ class replay:
         self._seq: int = 0
         self._originals: dict[str, Any] = {}
         self._frame_globals: dict[str, Any] | None = None
-        self._inputs = Inputs()
         self._cache_exceptions = cache_exceptions
         self._hooks = hooks
         self._context_token: Any = None
@@ -371,7 +395,7 @@ class replay:
     ) -> str:
         qualname = getattr(original, "__qualname__", name)
         try:
-            args_hash = self._inputs.compute(original, args, kwargs)
+            args_hash = _hash_arguments(original, args, kwargs)
         except (ValueError, TypeError):
             args_hash = "unhashable"
         raw_key = f"{self.identifier}:{seq}:{qualname}:{args_hash}"
@@ -1,8 +1,26 @@
-import base64
+import binascii
 import json
 import pickle
+import zlib
 from typing import Any, Protocol, runtime_checkable
 
+from stickynote.storage import MemoryStorage, MemoStorage
+
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
+
+def _b64encode(data: bytes) -> str:
+    # binascii skips the argument checks and copies `base64.b64encode` makes
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    # `a2b_base64` accepts ASCII strings directly, skipping an encode step
+    return binascii.a2b_base64(data)
+
 
 @runtime_checkable
 class Serializer(Protocol):
@@ -11,8 +29,18 @@ class Serializer(Protocol):
     def deserialize(self, data: str) -> Any: ...
 
 
+# Types the `json` module can encode at the top level, including their subclasses
+_JSON_TYPES = (dict, list, tuple, str, int, float, type(None))
+
+
 class JsonSerializer(Serializer):
     def serialize(self, obj: Any) -> str:
+        # Fail fast on values JSON can't encode, which is much cheaper than letting
+        # `json.dumps` raise so the next serializer in a chain can take over
+        if not isinstance(obj, _JSON_TYPES):
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
         return json.dumps(obj)
 
     def deserialize(self, data: str) -> Any:
@@ -21,36 +49,95 @@ class JsonSerializer(Serializer):
 
 class PickleSerializer(Serializer):
     def serialize(self, obj: Any) -> str:
-        return base64.b64encode(pickle.dumps(obj)).decode("utf-8")
+        return _b64encode(pickle.dumps(obj, protocol=5))
 
     def deserialize(self, data: str) -> Any:
-        return pickle.loads(base64.b64decode(data.encode("utf-8")))
+        return pickle.loads(_b64decode(data))
 
 
 class CloudPickleSerializer(Serializer):
     def serialize(self, obj: Any) -> str:
-        try:
-            import cloudpickle
-        except ImportError:
-            raise ImportError(
-                "Unable to import cloudpickle. "
-                "Please install 'stickynote[cloudpickle]' to use this serializer."
-            ) from None
-        return base64.b64encode(cloudpickle.dumps(obj)).decode("utf-8")
+        if cloudpickle is None:
+            raise _cloudpickle_import_error()
+        return _b64encode(cloudpickle.dumps(obj))
 
     def deserialize(self, data: str) -> Any:
-        try:
-            import cloudpickle
-        except ImportError:
-            raise ImportError(
-                "Unable to import cloudpickle. "
-                "Please install 'stickynote[cloudpickle]' to use this serializer."
-            ) from None
+        if cloudpickle is None:
+            raise _cloudpickle_import_error()
+        return cloudpickle.loads(_b64decode(data))
+
+
+class CompressedSerializer(Serializer):
+    """
+    Serializer that compresses the output of another serializer with zlib, cutting
+    the bytes written to and read from storage for large, repetitive results.
+
+    Compressed output is base64 encoded to fit the text-based storage protocol, so
+    it only pays off for results that compress well, like most JSON and pickles.
 
-        return cloudpickle.loads(base64.b64decode(data.encode("utf-8")))
+    Args:
+        serializer: The serializer whose output is compressed.
+        level: The zlib compression level. Defaults to 1, the fastest.
+        min_size: Serialized results shorter than this are stored uncompressed.
+            Defaults to 128.
+    """
+
+    def __init__(self, serializer: Serializer, level: int = 1, min_size: int = 128):
+        self.serializer = serializer
+        self.level = level
+        self.min_size = min_size
+
+    def serialize(self, obj: Any) -> str:
+        data = self.serializer.serialize(obj)
+        if len(data) >= self.min_size:
+            compressed = _b64encode(zlib.compress(data.encode("utf-8"), self.level))
+            if len(compressed) < len(data):
+                return _COMPRESSED + compressed
+        return _UNCOMPRESSED + data
+
+    def deserialize(self, data: str) -> Any:
+        marker = data[:1]
+        if marker == _COMPRESSED:
+            return self.serializer.deserialize(
+                zlib.decompress(_b64decode(data[1:])).decode("utf-8")
+            )
+        if marker == _UNCOMPRESSED:
+            return self.serializer.deserialize(data[1:])
+        raise ValueError("Data was not written by CompressedSerializer")
+
+
+# Leading markers telling `CompressedSerializer` whether its output was compressed
+_COMPRESSED = "z"
+_UNCOMPRESSED = "="
+
+
+def _cloudpickle_import_error() -> ImportError:
+    return ImportError(
+        "Unable to import cloudpickle. "
+        "Please install 'stickynote[cloudpickle]' to use this serializer."
+    )
 
 
 DEFAULT_SERIALIZER_CHAIN: tuple[Serializer, ...] = (
     JsonSerializer(),
     PickleSerializer(),
 )
+
+# In-process storage never leaves the interpreter, so results are pickled first:
+# pickle is faster than JSON for most values and round-trips Python types exactly.
+MEMORY_SERIALIZER_CHAIN: tuple[Serializer, ...] = (
+    PickleSerializer(),
+    JsonSerializer(),
+)
+
+
+def serializer_for(storage: MemoStorage) -> tuple[Serializer, ...]:
+    """
+    Get the default serializer chain for a storage backend.
+
+    Args:
+        storage: The storage that memoized results will be saved to.
+    """
+    if isinstance(storage, MemoryStorage):
+        return MEMORY_SERIALIZER_CHAIN
+    return DEFAULT_SERIALIZER_CHAIN
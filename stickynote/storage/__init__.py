@@ -1,16 +1,19 @@
-from .base import ExpiredMemoError, MemoStorage, MissingMemoError
+from .base import MISSING, ExpiredMemoError, MemoStorage, MissingMemoError
 from .file import FileStorage
 from .memory import MemoryStorage
 from .redis import RedisStorage
+from .tiered import TieredStorage
 
 DEFAULT_STORAGE: MemoStorage = MemoryStorage()
 
 __all__ = [
     "DEFAULT_STORAGE",
+    "MISSING",
     "ExpiredMemoError",
     "FileStorage",
     "MemoStorage",
     "MemoryStorage",
     "MissingMemoError",
     "RedisStorage",
+    "TieredStorage",
 ]
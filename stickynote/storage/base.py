@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import enum
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from typing import Protocol
+from typing import Final, Protocol
 
 
 class MissingMemoError(Exception):
@@ -17,11 +19,33 @@ class ExpiredMemoError(MissingMemoError):
     """
 
 
+class _Missing(enum.Enum):
+    """
+    Type of the `MISSING` sentinel. An enum so type checkers can narrow
+    `value is MISSING` checks.
+    """
+
+    MISSING = enum.auto()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Final = _Missing.MISSING
+"""
+Sentinel returned by `MemoStorage.get_or_miss` when no valid memo exists for a key.
+"""
+
+
 class MemoStorage(Protocol):
     """
     Protocol for a storage backend to store and retrieve memoized results.
     """
 
+    # Backends that keep values in-process can set this to store results as
+    # native Python objects, skipping serialization entirely.
+    native: bool = False
+
     def exists(
         self,
         key: str,
@@ -84,6 +108,87 @@ class MemoStorage(Protocol):
         """
         ...  # pragma: no cover
 
+    def get_or_miss(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key from the backend in a single lookup, returning
+        `MISSING` instead of raising if the key doesn't exist or is expired.
+
+        Backends should override this when they can answer with fewer round trips
+        than the default `get` call.
+
+        Args:
+            key: The key to retrieve
+            created_after: Only consider records created at or after this datetime
+        """
+        try:
+            return self.get(key, created_after=created_after)
+        except MissingMemoError:
+            return MISSING
+
+    async def get_or_miss_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key from the backend in a single lookup, returning
+        `MISSING` instead of raising if the key doesn't exist or is expired.
+
+        Backends should override this when they can answer with fewer round trips
+        than the default `get_async` call.
+
+        Args:
+            key: The key to retrieve
+            created_after: Only consider records created at or after this datetime
+        """
+        try:
+            return await self.get_async(key, created_after=created_after)
+        except MissingMemoError:
+            return MISSING
+
+    def get_many(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys from the backend, with `MISSING` in place of
+        keys that don't exist or are expired.
+
+        Backends should override this when they can fetch several keys in fewer
+        round trips than one `get_or_miss` call per key.
+
+        Args:
+            keys: The keys to retrieve
+            created_after: Only consider records created at or after this datetime
+        """
+        return [self.get_or_miss(key, created_after=created_after) for key in keys]
+
+    async def get_many_async(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys from the backend, with `MISSING` in place of
+        keys that don't exist or are expired.
+
+        Backends should override this when they can fetch several keys in fewer
+        round trips than one `get_or_miss_async` call per key.
+
+        Args:
+            keys: The keys to retrieve
+            created_after: Only consider records created at or after this datetime
+        """
+        return [
+            await self.get_or_miss_async(key, created_after=created_after)
+            for key in keys
+        ]
+
     def set(self, key: str, value: str) -> None:
         """
         Set the value of a key in the backend.
@@ -96,6 +201,26 @@ class MemoStorage(Protocol):
         """
         ...  # pragma: no cover
 
+    def set_many(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in the backend.
+
+        Backends should override this when they can write several keys in fewer
+        round trips than one `set` call per key.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
+    async def set_many_async(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in the backend.
+
+        Backends should override this when they can write several keys in fewer
+        round trips than one `set_async` call per key.
+        """
+        for key, value in items.items():
+            await self.set_async(key, value)
+
     def delete(self, key: str) -> None:
         """
         Delete a key from storage. No-op if key doesn't exist (idempotent).
@@ -113,3 +238,65 @@ class MemoStorage(Protocol):
             key: The key to delete
         """
         ...  # pragma: no cover
+
+
+# `MemoStorage` is a protocol, so storages may implement it without subclassing it
+# and inheriting the default implementations of the optional methods. These
+# helpers fall back to the defaults for such storages.
+
+
+def _get_or_miss(
+    storage: MemoStorage, key: str, created_after: datetime | None = None
+) -> str | _Missing:
+    get_or_miss = getattr(storage, "get_or_miss", None)
+    if get_or_miss is not None:
+        return get_or_miss(key, created_after=created_after)
+    return MemoStorage.get_or_miss(storage, key, created_after=created_after)
+
+
+async def _get_or_miss_async(
+    storage: MemoStorage, key: str, created_after: datetime | None = None
+) -> str | _Missing:
+    get_or_miss_async = getattr(storage, "get_or_miss_async", None)
+    if get_or_miss_async is not None:
+        return await get_or_miss_async(key, created_after=created_after)
+    return await MemoStorage.get_or_miss_async(
+        storage, key, created_after=created_after
+    )
+
+
+def _get_many(
+    storage: MemoStorage, keys: Sequence[str], created_after: datetime | None = None
+) -> list[str | _Missing]:
+    get_many = getattr(storage, "get_many", None)
+    if get_many is not None:
+        return get_many(keys, created_after=created_after)
+    return [_get_or_miss(storage, key, created_after=created_after) for key in keys]
+
+
+async def _get_many_async(
+    storage: MemoStorage, keys: Sequence[str], created_after: datetime | None = None
+) -> list[str | _Missing]:
+    get_many_async = getattr(storage, "get_many_async", None)
+    if get_many_async is not None:
+        return await get_many_async(keys, created_after=created_after)
+    return [
+        await _get_or_miss_async(storage, key, created_after=created_after)
+        for key in keys
+    ]
+
+
+def _set_many(storage: MemoStorage, items: Mapping[str, str]) -> None:
+    set_many = getattr(storage, "set_many", None)
+    if set_many is not None:
+        set_many(items)
+        return
+    MemoStorage.set_many(storage, items)
+
+
+async def _set_many_async(storage: MemoStorage, items: Mapping[str, str]) -> None:
+    set_many_async = getattr(storage, "set_many_async", None)
+    if set_many_async is not None:
+        await set_many_async(items)
+        return
+    await MemoStorage.set_many_async(storage, items)
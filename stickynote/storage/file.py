@@ -1,28 +1,83 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+import contextlib
+import os
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
+from typing import Any, TypeVar
 
-from .base import ExpiredMemoError, MemoStorage, MissingMemoError
+from .base import MISSING, ExpiredMemoError, MemoStorage, MissingMemoError, _Missing
 
 _HOME = Path.home()
 
+T = TypeVar("T")
+
+
+def _is_fresh(stat_result: os.stat_result, created_after: datetime) -> bool:
+    # Compare POSIX timestamps rather than building a datetime from the mtime
+    return stat_result.st_mtime >= created_after.timestamp()
+
 
 class FileStorage(MemoStorage):
     """
     Disk-based storage for storing and retrieving memoized results.
+
+    Args:
+        path: The directory to store memo files in. Defaults to `~/.stickynote`.
+        shard: Spread memo files over two levels of subdirectories named after the
+            first two pairs of characters of their keys, like `ab/cd/abcd...`, so
+            no directory grows too large for the filesystem to look up quickly.
+            Meant for the hashed keys produced by the built-in key strategies.
+            Memos written with one layout aren't found with the other. Defaults
+            to `False`.
     """
 
-    def __init__(self, path: Path | str = _HOME / ".stickynote"):
-        self.path: Path = Path(path)
+    def __init__(self, path: Path | str = _HOME / ".stickynote", shard: bool = False):
+        self.path = Path(path)
+        self.shard = shard
 
-    def _ensure_directory_exists(self) -> None:
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        # Async methods run their blocking file I/O here rather than in the event
+        # loop's default executor, so memo I/O doesn't compete with other work
+        # offloaded there. Created on first use, so sync-only storages never
+        # build one.
+        return ThreadPoolExecutor(thread_name_prefix="stickynote-file")
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Executors can't be pickled; a copy creates its own when first needed
+        state = self.__dict__.copy()
+        state.pop("_executor", None)
+        return state
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
         """
-        Ensure the storage directory exists, creating it if necessary.
+        Run a blocking function on the storage's I/O threads.
         """
-        if not self.path.exists():
-            self.path.mkdir(parents=True, exist_ok=True)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @path.setter
+    def path(self, path: Path) -> None:
+        self._path = path
+        # Memo file paths are built by string concatenation on every call, which
+        # is much cheaper than joining `Path` objects
+        self._prefix = os.path.join(path, "")
+
+    def _file(self, key: str) -> str:
+        if self.shard:
+            return f"{self._prefix}{key[:2]}{os.sep}{key[2:4]}{os.sep}{key}"
+        return self._prefix + key
 
     def _is_valid(
         self,
@@ -37,16 +92,11 @@ class FileStorage(MemoStorage):
             key: The key to check
             created_after: Only consider records created at or after this datetime
         """
-        path = self.path / key
-        if not path.exists():
+        try:
+            stat_result = os.stat(self._file(key))
+        except FileNotFoundError:
             return False
-        stat_result = path.stat()
-        if created_after is not None:
-            created_at = datetime.fromtimestamp(stat_result.st_mtime)
-            created_at = created_at.astimezone(tz=timezone.utc)
-            if created_at < created_after:
-                return False
-        return True
+        return created_after is None or _is_fresh(stat_result, created_after)
 
     def exists(
         self,
@@ -74,9 +124,7 @@ class FileStorage(MemoStorage):
             key: The key to check
             created_after: Only consider records created at or after this datetime
         """
-        return await asyncio.to_thread(
-            self.exists, key=key, created_after=created_after
-        )
+        return await self._run(self.exists, key, created_after)
 
     def get(
         self,
@@ -91,12 +139,12 @@ class FileStorage(MemoStorage):
             created_after: Only consider records created at or after this datetime
         """
         try:
-            value = (self.path / key).read_text()
+            value = self._read(key, created_after)
         except FileNotFoundError as e:
             raise MissingMemoError(
                 f"Memo for key {key} not found in file storage"
             ) from e
-        if not self._is_valid(key, created_after):
+        if value is None:
             raise ExpiredMemoError(f"Memo for key {key} has expired in file storage")
         return value
 
@@ -112,7 +160,72 @@ class FileStorage(MemoStorage):
             key: The key to get the value for
             created_after: Only consider records created at or after this datetime
         """
-        return await asyncio.to_thread(self.get, key=key, created_after=created_after)
+        return await self._run(self.get, key, created_after)
+
+    def get_or_miss(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value for memoized result for the given key, or `MISSING` if it
+        doesn't exist or is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        try:
+            value = self._read(key, created_after)
+        except FileNotFoundError:
+            return MISSING
+        return MISSING if value is None else value
+
+    def _read(self, key: str, created_after: datetime | None) -> str | None:
+        """
+        Read the memo file for a key, checking its age on the open file so the file
+        is opened and stat'ed once. Returns `None` if the memo has expired.
+
+        Raises:
+            FileNotFoundError: If there is no memo file for the key
+        """
+        with open(self._file(key)) as file:
+            if created_after is not None and not _is_fresh(
+                os.fstat(file.fileno()), created_after
+            ):
+                return None
+            return file.read()
+
+    async def get_or_miss_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value for memoized result for the given key, or `MISSING` if it
+        doesn't exist or is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        return await self._run(self.get_or_miss, key, created_after)
+
+    async def get_many_async(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys, with `MISSING` in place of keys that don't
+        exist or are expired. All files are read in a single hop to the storage's
+        I/O threads.
+
+        Args:
+            keys: The keys to get the values for
+            created_after: Only consider records created at or after this datetime
+        """
+        return await self._run(self.get_many, keys, created_after)
 
     def set(self, key: str, value: str) -> None:
         """
@@ -122,8 +235,7 @@ class FileStorage(MemoStorage):
             key: The key to set the value for
             value: The value to set
         """
-        self._ensure_directory_exists()
-        (self.path / key).write_text(value)
+        self._write(key, value)
 
     async def set_async(self, key: str, value: str) -> None:
         """
@@ -133,11 +245,45 @@ class FileStorage(MemoStorage):
             key: The key to set the value for
             value: The value to set
         """
-        self._ensure_directory_exists()
-        await asyncio.to_thread((self.path / key).write_text, value)
+        # Creating the directory happens on the I/O thread too, in the same hop
+        await self._run(self.set, key, value)
+
+    async def set_many_async(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys. All files are written in a single hop to
+        the storage's I/O threads.
+
+        Args:
+            items: The keys and values to set
+        """
+        await self._run(self.set_many, items)
+
+    def _write(self, key: str, value: str) -> None:
+        """
+        Write a memo file atomically, so concurrent readers never see a partially
+        written memo.
+        """
+        path = self._file(key)
+        # Unique per writer so concurrent writes of the same key don't interleave
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            file = open(temp_path, "w")  # noqa: SIM115
+        except FileNotFoundError:
+            # Directories are only created once a write needs them
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file = open(temp_path, "w")  # noqa: SIM115
+        try:
+            with file:
+                file.write(value)
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
 
     def delete(self, key: str) -> None:
-        (self.path / key).unlink(missing_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._file(key))
 
     async def delete_async(self, key: str) -> None:
-        await asyncio.to_thread(self.delete, key)
+        await self._run(self.delete, key)
@@ -1,23 +1,74 @@
 from __future__ import annotations
 
+import contextlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
-from typing import TypedDict
+from typing import Any
 
-from .base import ExpiredMemoError, MemoStorage, MissingMemoError
-
-
-class MemoRecordMetadata(TypedDict):
-    created_at: datetime
+from .base import MISSING, ExpiredMemoError, MemoStorage, MissingMemoError, _Missing
 
 
 class MemoryStorage(MemoStorage):
     """
     In-memory storage for storing and retrieving memoized results.
+
+    Args:
+        maxsize: The maximum number of memos to keep. When set, the least recently
+            used memo is evicted once the storage grows past this size. Defaults to
+            `None`, which keeps every memo.
+        native: Store memoized results as native Python objects instead of
+            serializing them. Cache hits then return the stored object itself, so
+            callers must not mutate results. Defaults to `False`.
     """
 
-    def __init__(self):
-        self.cache: dict[str, str] = {}
-        self.metadata: dict[str, MemoRecordMetadata] = {}
+    def __init__(self, maxsize: int | None = None, native: bool = False):
+        self.maxsize = maxsize
+        self.native = native
+        self.cache: OrderedDict[str, Any] = OrderedDict()
+        # Creation time of each memo, stored directly rather than in a per-memo
+        # record dict so each entry costs a single datetime
+        self.metadata: dict[str, datetime] = {}
+        # Writes update both dicts and may evict, so they're serialized. Reads
+        # stay lock-free: metadata is written before a key becomes visible in the
+        # cache, and a key evicted mid-read is treated as a miss.
+        self._write_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks can't be pickled; a copy gets a fresh one
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._write_lock = threading.Lock()
+
+    def _touch(self, key: str) -> None:
+        """
+        Mark a key as most recently used.
+        """
+        if self.maxsize is not None:
+            # The key may have been evicted by a concurrent write
+            with contextlib.suppress(KeyError):
+                self.cache.move_to_end(key)
+
+    def _store(self, key: str, value: str, created_at: datetime | None = None) -> None:
+        """
+        Store a value with the current timestamp, or `created_at` if given, evicting
+        the least recently used memo if the storage is over capacity.
+        """
+        if created_at is None:
+            created_at = datetime.now(timezone.utc)
+        with self._write_lock:
+            self.metadata[key] = created_at
+            self.cache[key] = value
+            if self.maxsize is not None:
+                self.cache.move_to_end(key)
+                if len(self.cache) > self.maxsize:
+                    evicted, _ = self.cache.popitem(last=False)
+                    del self.metadata[evicted]
 
     def _is_valid(self, key: str, created_after: datetime | None) -> bool:
         """
@@ -27,7 +78,10 @@ class MemoryStorage(MemoStorage):
             key: The key to check
             created_after: Only consider records created at or after this datetime
         """
-        created_at = self.metadata[key]["created_at"]
+        created_at = self.metadata.get(key)
+        if created_at is None:
+            # Evicted by a concurrent write
+            return False
 
         # Check if created before cutoff
         return not (created_after and created_at < created_after)
@@ -72,7 +126,8 @@ class MemoryStorage(MemoStorage):
             key: The key to get the value for
             created_after: Only consider records created at or after this datetime
         """
-        if key not in self.cache:
+        value = self.cache.get(key, MISSING)
+        if value is MISSING:
             raise MissingMemoError(f"Memo for key {key} not found in memory cache")
 
         if not self._is_valid(key, created_after):
@@ -80,7 +135,8 @@ class MemoryStorage(MemoStorage):
                 f"Memo for key {key} was created outside the requested time window"
             )
 
-        return self.cache[key]
+        self._touch(key)
+        return value
 
     async def get_async(
         self,
@@ -94,7 +150,8 @@ class MemoryStorage(MemoStorage):
             key: The key to get the value for
             created_after: Only consider records created at or after this datetime
         """
-        if key not in self.cache:
+        value = self.cache.get(key, MISSING)
+        if value is MISSING:
             raise MissingMemoError(f"Memo for key {key} not found in memory cache")
 
         if not self._is_valid(key, created_after):
@@ -102,7 +159,74 @@ class MemoryStorage(MemoStorage):
                 f"Memo for key {key} was created outside the requested time window"
             )
 
-        return self.cache[key]
+        self._touch(key)
+        return value
+
+    def get_or_miss(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key from the cache, or `MISSING` if it doesn't exist or
+        is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        value = self.cache.get(key, MISSING)
+        if value is MISSING or (
+            created_after is not None and not self._is_valid(key, created_after)
+        ):
+            return MISSING
+        self._touch(key)
+        return value
+
+    async def get_or_miss_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key from the cache, or `MISSING` if it doesn't exist or
+        is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        return self.get_or_miss(key, created_after)
+
+    def get_many(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys from the cache, with `MISSING` in place of
+        keys that don't exist or are expired.
+
+        Args:
+            keys: The keys to get the values for
+            created_after: Only consider records created at or after this datetime
+        """
+        return [self.get_or_miss(key, created_after) for key in keys]
+
+    async def get_many_async(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys from the cache, with `MISSING` in place of
+        keys that don't exist or are expired.
+
+        Args:
+            keys: The keys to get the values for
+            created_after: Only consider records created at or after this datetime
+        """
+        return self.get_many(keys, created_after)
 
     def set(self, key: str, value: str) -> None:
         """
@@ -112,8 +236,7 @@ class MemoryStorage(MemoStorage):
             key: The key to set the value for
             value: The value to set
         """
-        self.cache[key] = value
-        self.metadata[key] = {"created_at": datetime.now(timezone.utc)}
+        self._store(key, value)
 
     async def set_async(self, key: str, value: str) -> None:
         """
@@ -123,12 +246,53 @@ class MemoryStorage(MemoStorage):
             key: The key to set the value for
             value: The value to set
         """
-        self.cache[key] = value
-        self.metadata[key] = {"created_at": datetime.now(timezone.utc)}
+        self._store(key, value)
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in the cache with current timestamp.
+
+        Args:
+            items: The keys and values to set
+        """
+        for key, value in items.items():
+            self._store(key, value)
+
+    async def set_many_async(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in the cache with current timestamp.
+
+        Args:
+            items: The keys and values to set
+        """
+        self.set_many(items)
+
+    def purge_expired(self, created_before: datetime) -> int:
+        """
+        Remove memos created before a cutoff, freeing their memory. Expired memos
+        are otherwise only skipped by lookups, never removed.
+
+        Args:
+            created_before: Remove records created before this datetime
+
+        Returns:
+            The number of memos removed
+        """
+        with self._write_lock:
+            expired = [
+                key
+                for key, created_at in self.metadata.items()
+                if created_at < created_before
+            ]
+            for key in expired:
+                del self.cache[key]
+                del self.metadata[key]
+        return len(expired)
 
     def delete(self, key: str) -> None:
-        self.cache.pop(key, None)
-        self.metadata.pop(key, None)
+        with self._write_lock:
+            self.cache.pop(key, None)
+            self.metadata.pop(key, None)
 
     async def delete_async(self, key: str) -> None:
         self.delete(key)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
-from .base import ExpiredMemoError, MemoStorage, MissingMemoError
+from .base import MISSING, ExpiredMemoError, MemoStorage, MissingMemoError, _Missing
 
 try:
     import redis
@@ -16,9 +18,48 @@ if TYPE_CHECKING:
     from redis.asyncio import Redis as AsyncRedisClient  # pragma: no cover
 
 
+def _is_fresh(created_at_timestamp: str | None, created_after: datetime | None) -> bool:
+    """
+    Check a memo's stored creation time against the requested time window.
+
+    Args:
+        created_at_timestamp: The memo's ISO creation time, or `None` if missing
+        created_after: Only consider records created at or after this datetime
+    """
+    if created_at_timestamp is None:
+        return False
+    created_at = datetime.fromisoformat(created_at_timestamp)
+    return not (created_after is not None and created_at < created_after)
+
+
+def _checked(
+    key: str,
+    value: str | None,
+    created_at_timestamp: str | None,
+    created_after: datetime | None,
+) -> str:
+    """
+    Return a fetched memo value, raising if it's missing or outside the requested
+    time window.
+    """
+    if value is None:
+        raise MissingMemoError(f"Memo for key {key} not found in Redis")
+    if not _is_fresh(created_at_timestamp, created_after):
+        raise ExpiredMemoError(
+            f"Memo for key {key} is not valid in the requested time window"
+        )
+    return value
+
+
 class RedisStorage(MemoStorage):
     """
     Redis-based storage for storing and retrieving memoized results.
+
+    Args:
+        ttl: How long Redis keeps each memo before expiring it, so memos older
+            than any `max_age` in use don't accumulate in Redis. Defaults to `None`,
+            which keeps memos until they're deleted. Redis expires keys in whole
+            seconds, so `ttl` must be at least one second.
     """
 
     def __init__(
@@ -28,6 +69,7 @@ class RedisStorage(MemoStorage):
         db: int = 0,
         password: str | None = None,
         prefix: str = "stickynote:",
+        ttl: timedelta | None = None,
         **kwargs: Any,
     ):
         if redis is None:
@@ -36,23 +78,31 @@ class RedisStorage(MemoStorage):
                 "Install it with: pip install 'stickynote[redis]'"
             )
 
+        if ttl is not None and ttl < timedelta(seconds=1):
+            raise ValueError(f"ttl must be at least one second, got {ttl!r}")
+
         self.prefix = prefix
-        self.client: RedisClient = redis.Redis(
-            host=host,
-            port=port,
-            db=db,
-            password=password,
-            decode_responses=True,
-            **kwargs,
-        )
-        self.async_client: AsyncRedisClient = redis.asyncio.Redis(
-            host=host,
-            port=port,
-            db=db,
-            password=password,
-            decode_responses=True,
+        self.ttl = ttl
+        self._connection_kwargs: dict[str, Any] = {
+            "host": host,
+            "port": port,
+            "db": db,
+            "password": password,
+            "decode_responses": True,
             **kwargs,
-        )
+        }
+
+    # Clients are only created when first used, so an application that only uses
+    # the sync or the async API doesn't build a connection pool for the other
+    @cached_property
+    def client(self) -> RedisClient:
+        assert redis is not None  # Checked in __init__
+        return redis.Redis(**self._connection_kwargs)
+
+    @cached_property
+    def async_client(self) -> AsyncRedisClient:
+        assert redis is not None  # Checked in __init__
+        return redis.asyncio.Redis(**self._connection_kwargs)
 
     def _key(self, key: str) -> str:
         """Add prefix to key."""
@@ -62,103 +112,190 @@ class RedisStorage(MemoStorage):
         """Add created_at to key."""
         return f"{self.prefix}{key}:created_at"
 
-    def _is_valid(
+    def exists(
         self,
         key: str,
         created_after: datetime | None = None,
     ) -> bool:
         """
-        Check if a key is valid according to expiration rules.
-
-        Args:
-            key: The key to check
-            created_after: Only consider records created at or after this datetime
+        Check if a key exists in Redis. The key and its creation time are checked
+        in one round trip.
         """
-        created_at_timestamp = cast(
-            str | None, self.client.get(self._created_at_key(key))
-        )
-        if created_at_timestamp is None:
-            return False
-        created_at = datetime.fromisoformat(created_at_timestamp)
-        return not (created_after is not None and created_at < created_after)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.exists(self._key(key))
+        pipe.get(self._created_at_key(key))
+        exists, created_at_timestamp = pipe.execute()
+        return bool(exists) and _is_fresh(created_at_timestamp, created_after)
 
-    async def _is_valid_async(
+    async def exists_async(
         self,
         key: str,
         created_after: datetime | None = None,
     ) -> bool:
         """
-        Check if a key is valid according to expiration rules.
+        Check if a key exists in Redis. The key and its creation time are checked
+        in one round trip.
+        """
+        pipe = self.async_client.pipeline(transaction=False)
+        pipe.exists(self._key(key))
+        pipe.get(self._created_at_key(key))
+        exists, created_at_timestamp = await pipe.execute()
+        return bool(exists) and _is_fresh(created_at_timestamp, created_after)
 
-        Args:
-            key: The key to check
-            created_after: Only consider records created at or after this datetime
+    def get(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str:
         """
-        created_at_timestamp = cast(
-            str | None, await self.async_client.get(self._created_at_key(key))
+        Get the value of a key from Redis. The value and its creation time are
+        fetched in one round trip.
+        """
+        value, created_at_timestamp = cast(
+            list[str | None],
+            self.client.mget(self._key(key), self._created_at_key(key)),
         )
-        if created_at_timestamp is None:
-            return False
-        created_at = datetime.fromisoformat(created_at_timestamp)
-        return not (created_after is not None and created_at < created_after)
+        return _checked(key, value, created_at_timestamp, created_after)
 
-    def exists(
+    async def get_async(
         self,
         key: str,
         created_after: datetime | None = None,
-    ) -> bool:
+    ) -> str:
         """
-        Check if a key exists in Redis.
+        Get the value of a key from Redis. The value and its creation time are
+        fetched in one round trip.
         """
-        return bool(self.client.exists(self._key(key))) and self._is_valid(
-            key, created_after
+        value, created_at_timestamp = cast(
+            list[str | None],
+            await self.async_client.mget(self._key(key), self._created_at_key(key)),
         )
+        return _checked(key, value, created_at_timestamp, created_after)
 
-    async def exists_async(
+    def get_or_miss(
         self,
         key: str,
         created_after: datetime | None = None,
-    ) -> bool:
+    ) -> str | _Missing:
         """
-        Check if a key exists in Redis.
+        Get the value of a key from Redis, or `MISSING` if it doesn't exist or is
+        expired. The value and its creation time are fetched in one round trip.
         """
-        return bool(
-            await self.async_client.exists(self._key(key))
-        ) and await self._is_valid_async(key, created_after)
+        value, created_at_timestamp = cast(
+            list[str | None],
+            self.client.mget(self._key(key), self._created_at_key(key)),
+        )
+        if value is None or not _is_fresh(created_at_timestamp, created_after):
+            return MISSING
+        return value
 
-    def get(
+    async def get_or_miss_async(
         self,
         key: str,
         created_after: datetime | None = None,
-    ) -> str:
+    ) -> str | _Missing:
         """
-        Get the value of a key from Redis.
+        Get the value of a key from Redis, or `MISSING` if it doesn't exist or is
+        expired. The value and its creation time are fetched in one round trip.
         """
-        value = cast(str | None, self.client.get(self._key(key)))
-        if value is None:
-            raise MissingMemoError(f"Memo for key {key} not found in Redis")
-        if not self._is_valid(key, created_after):
-            raise ExpiredMemoError(
-                f"Memo for key {key} is not valid in the requested time window"
-            )
+        value, created_at_timestamp = cast(
+            list[str | None],
+            await self.async_client.mget(self._key(key), self._created_at_key(key)),
+        )
+        if value is None or not _is_fresh(created_at_timestamp, created_after):
+            return MISSING
         return value
 
-    async def get_async(
+    def _mget_keys(self, keys: Sequence[str]) -> list[str]:
+        """Interleave the value and created_at keys for a batch lookup."""
+        return [
+            redis_key
+            for key in keys
+            for redis_key in (self._key(key), self._created_at_key(key))
+        ]
+
+    def _timestamped(self, items: Mapping[str, str]) -> dict[str, str]:
+        """Map the value and created_at keys for a batch write."""
+        created_at = datetime.now(timezone.utc).isoformat()
+        mapping: dict[str, str] = {}
+        for key, value in items.items():
+            mapping[self._key(key)] = value
+            mapping[self._created_at_key(key)] = created_at
+        return mapping
+
+    def get_many(
         self,
-        key: str,
+        keys: Sequence[str],
         created_after: datetime | None = None,
-    ) -> str:
+    ) -> list[str | _Missing]:
         """
-        Get the value of a key from Redis.
+        Get the values of several keys from Redis, with `MISSING` in place of keys
+        that don't exist or are expired. All keys are fetched with a single MGET.
         """
-        value = cast(str | None, await self.async_client.get(self._key(key)))
-        if value is None:
-            raise MissingMemoError(f"Memo for key {key} not found in Redis")
-        if not await self._is_valid_async(key, created_after):
-            raise ExpiredMemoError(
-                f"Memo for key {key} is not valid in the requested time window"
+        if not keys:
+            return []
+        results = cast(list[str | None], self.client.mget(self._mget_keys(keys)))
+        return [
+            value
+            if value is not None and _is_fresh(created_at_timestamp, created_after)
+            else MISSING
+            for value, created_at_timestamp in zip(
+                results[::2], results[1::2], strict=True
             )
-        return value
+        ]
+
+    async def get_many_async(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys from Redis, with `MISSING` in place of keys
+        that don't exist or are expired. All keys are fetched with a single MGET.
+        """
+        if not keys:
+            return []
+        results = cast(
+            list[str | None], await self.async_client.mget(self._mget_keys(keys))
+        )
+        return [
+            value
+            if value is not None and _is_fresh(created_at_timestamp, created_after)
+            else MISSING
+            for value, created_at_timestamp in zip(
+                results[::2], results[1::2], strict=True
+            )
+        ]
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in Redis in a single round trip.
+        """
+        if not items:
+            return
+        if self.ttl is None:
+            self.client.mset(self._timestamped(items))
+            return
+        # MSET can't set an expiry, so expiring keys are written in a pipeline
+        pipe = self.client.pipeline(transaction=False)
+        for redis_key, value in self._timestamped(items).items():
+            pipe.set(redis_key, value, ex=self.ttl)
+        pipe.execute()
+
+    async def set_many_async(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in Redis in a single round trip.
+        """
+        if not items:
+            return
+        if self.ttl is None:
+            await self.async_client.mset(self._timestamped(items))
+            return
+        # MSET can't set an expiry, so expiring keys are written in a pipeline
+        pipe = self.async_client.pipeline(transaction=False)
+        for redis_key, value in self._timestamped(items).items():
+            pipe.set(redis_key, value, ex=self.ttl)
+        await pipe.execute()
 
     def set(self, key: str, value: str) -> None:
         """
@@ -169,8 +306,12 @@ class RedisStorage(MemoStorage):
             value: The value to set
         """
         pipe = self.client.pipeline()
-        pipe.set(self._key(key), value)
-        pipe.set(self._created_at_key(key), datetime.now(timezone.utc).isoformat())
+        pipe.set(self._key(key), value, ex=self.ttl)
+        pipe.set(
+            self._created_at_key(key),
+            datetime.now(timezone.utc).isoformat(),
+            ex=self.ttl,
+        )
         pipe.execute()
 
     async def set_async(self, key: str, value: str) -> None:
@@ -182,8 +323,12 @@ class RedisStorage(MemoStorage):
             value: The value to set
         """
         pipe = self.async_client.pipeline()
-        pipe.set(self._key(key), value)
-        pipe.set(self._created_at_key(key), datetime.now(timezone.utc).isoformat())
+        pipe.set(self._key(key), value, ex=self.ttl)
+        pipe.set(
+            self._created_at_key(key),
+            datetime.now(timezone.utc).isoformat(),
+            ex=self.ttl,
+        )
         await pipe.execute()
 
     def delete(self, key: str) -> None:
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+
+from .base import (
+    MISSING,
+    MemoStorage,
+    _get_many,
+    _get_many_async,
+    _get_or_miss,
+    _get_or_miss_async,
+    _Missing,
+    _set_many,
+    _set_many_async,
+)
+from .memory import MemoryStorage
+
+# Timestamp given to memos copied into the in-process tier on a read. Their real
+# creation time is unknown, so they only satisfy lookups without a cutoff.
+_UNKNOWN_CREATED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class TieredStorage(MemoStorage):
+    """
+    Storage that keeps recently used memos in a bounded in-process cache in front of
+    another storage backend, skipping the backend's I/O for hot keys.
+
+    Memos are written to both tiers. Memos read from the backend are copied into
+    the in-process cache, but only serve later lookups that don't set a
+    `created_after` cutoff, since their creation time isn't known.
+
+    Args:
+        backend: The storage to cache memos from.
+        maxsize: The maximum number of memos to keep in process. Defaults to 1024.
+    """
+
+    def __init__(self, backend: MemoStorage, maxsize: int = 1024):
+        self.backend = backend
+        self.native = getattr(backend, "native", False)
+        self.l1 = MemoryStorage(maxsize=maxsize, native=self.native)
+
+    def exists(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> bool:
+        """
+        Check if a key exists in either tier and is valid according to expiration
+        rules.
+
+        Args:
+            key: The key to check
+            created_after: Only consider records created at or after this datetime
+        """
+        return self.l1.exists(key, created_after) or self.backend.exists(
+            key, created_after=created_after
+        )
+
+    async def exists_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> bool:
+        """
+        Check if a key exists in either tier and is valid according to expiration
+        rules.
+
+        Args:
+            key: The key to check
+            created_after: Only consider records created at or after this datetime
+        """
+        return self.l1.exists(key, created_after) or await self.backend.exists_async(
+            key, created_after=created_after
+        )
+
+    def get(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str:
+        """
+        Get the value of a key, checking the in-process cache before the backend.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        value = self.l1.get_or_miss(key, created_after)
+        if value is not MISSING:
+            return value
+        value = self.backend.get(key, created_after=created_after)
+        self.l1._store(key, value, _UNKNOWN_CREATED_AT)
+        return value
+
+    async def get_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str:
+        """
+        Get the value of a key, checking the in-process cache before the backend.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        value = self.l1.get_or_miss(key, created_after)
+        if value is not MISSING:
+            return value
+        value = await self.backend.get_async(key, created_after=created_after)
+        self.l1._store(key, value, _UNKNOWN_CREATED_AT)
+        return value
+
+    def get_or_miss(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key, checking the in-process cache before the backend,
+        or `MISSING` if it doesn't exist or is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        value = self.l1.get_or_miss(key, created_after)
+        if value is not MISSING:
+            return value
+        value = _get_or_miss(self.backend, key, created_after=created_after)
+        if value is not MISSING:
+            self.l1._store(key, value, _UNKNOWN_CREATED_AT)
+        return value
+
+    async def get_or_miss_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,
+    ) -> str | _Missing:
+        """
+        Get the value of a key, checking the in-process cache before the backend,
+        or `MISSING` if it doesn't exist or is expired.
+
+        Args:
+            key: The key to get the value for
+            created_after: Only consider records created at or after this datetime
+        """
+        value = self.l1.get_or_miss(key, created_after)
+        if value is not MISSING:
+            return value
+        value = await _get_or_miss_async(self.backend, key, created_after=created_after)
+        if value is not MISSING:
+            self.l1._store(key, value, _UNKNOWN_CREATED_AT)
+        return value
+
+    def _l1_get_many(
+        self, keys: Sequence[str], created_after: datetime | None
+    ) -> tuple[list[str | _Missing], list[int]]:
+        """
+        Look keys up in the in-process cache, returning the values found along with
+        the positions of the keys that have to be fetched from the backend.
+        """
+        values = self.l1.get_many(keys, created_after)
+        return values, [i for i, value in enumerate(values) if value is MISSING]
+
+    def _fill(
+        self,
+        keys: Sequence[str],
+        values: list[str | _Missing],
+        misses: list[int],
+        fetched: list[str | _Missing],
+    ) -> list[str | _Missing]:
+        """
+        Merge values fetched from the backend into the results, copying them into
+        the in-process cache.
+        """
+        for i, value in zip(misses, fetched, strict=True):
+            if value is not MISSING:
+                self.l1._store(keys[i], value, _UNKNOWN_CREATED_AT)
+                values[i] = value
+        return values
+
+    def get_many(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys, with `MISSING` in place of keys that don't
+        exist or are expired. Keys missing from the in-process cache are fetched
+        from the backend in a single batch.
+
+        Args:
+            keys: The keys to get the values for
+            created_after: Only consider records created at or after this datetime
+        """
+        values, misses = self._l1_get_many(keys, created_after)
+        if not misses:
+            return values
+        fetched = _get_many(
+            self.backend, [keys[i] for i in misses], created_after=created_after
+        )
+        return self._fill(keys, values, misses, fetched)
+
+    async def get_many_async(
+        self,
+        keys: Sequence[str],
+        created_after: datetime | None = None,
+    ) -> list[str | _Missing]:
+        """
+        Get the values of several keys, with `MISSING` in place of keys that don't
+        exist or are expired. Keys missing from the in-process cache are fetched
+        from the backend in a single batch.
+
+        Args:
+            keys: The keys to get the values for
+            created_after: Only consider records created at or after this datetime
+        """
+        values, misses = self._l1_get_many(keys, created_after)
+        if not misses:
+            return values
+        fetched = await _get_many_async(
+            self.backend, [keys[i] for i in misses], created_after=created_after
+        )
+        return self._fill(keys, values, misses, fetched)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Set the value of a key in both tiers.
+
+        Args:
+            key: The key to set the value for
+            value: The value to set
+        """
+        self.backend.set(key, value)
+        self.l1.set(key, value)
+
+    async def set_async(self, key: str, value: str) -> None:
+        """
+        Set the value of a key in both tiers.
+
+        Args:
+            key: The key to set the value for
+            value: The value to set
+        """
+        await self.backend.set_async(key, value)
+        self.l1.set(key, value)
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in both tiers, writing them to the backend
+        in a single batch.
+
+        Args:
+            items: The keys and values to set
+        """
+        _set_many(self.backend, items)
+        self.l1.set_many(items)
+
+    async def set_many_async(self, items: Mapping[str, str]) -> None:
+        """
+        Set the values of several keys in both tiers, writing them to the backend
+        in a single batch.
+
+        Args:
+            items: The keys and values to set
+        """
+        await _set_many_async(self.backend, items)
+        self.l1.set_many(items)
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        self.backend.delete(key)
+
+    async def delete_async(self, key: str) -> None:
+        self.l1.delete(key)
+        await self.backend.delete_async(key)
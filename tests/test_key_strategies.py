@@ -1,5 +1,9 @@
+import hashlib
+import pickle
 import threading
+import weakref
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -7,7 +11,9 @@ from stickynote.key_strategies import (
     DEFAULT_STRATEGY,
     CompoundMemoKeyStrategy,
     Inputs,
+    MemoKeyStrategy,
     SourceCode,
+    _sig_cache,
 )
 
 
@@ -236,6 +242,12 @@ def test_inputs_strategy_with_json_serialization_failure():
     assert key1 != key3
 
 
+def test_inputs_strategy_pickles_with_a_fixed_protocol():
+    """Test that the pickle fallback doesn't depend on the default protocol."""
+    arguments = {"a": CanNotBeSerializedToJson(1), "b": bytearray(b"data")}
+    assert Inputs()._encode(arguments) == pickle.dumps(arguments, protocol=5)
+
+
 def test_inputs_strategy_with_pickle_serialization_failure():
     """Test the Inputs strategy when pickle serialization fails."""
     strategy = Inputs()
@@ -247,3 +259,320 @@ def test_inputs_strategy_with_pickle_serialization_failure():
     # Pass in a thread (which is not picklable)
     with pytest.raises(ValueError):
         strategy.compute(test_func, (threading.Thread(),), {})
+
+
+def test_inputs_strategy_with_variadic_arguments():
+    """Test that variadic arguments are normalized consistently."""
+    strategy = Inputs()
+
+    def test_func(a: Any, *args: Any, b: int = 1, **kwargs: Any) -> Any:
+        return a, args, b, kwargs
+
+    key1 = strategy.compute(test_func, (1,), {})
+    key2 = strategy.compute(test_func, (1,), {"b": 1})
+    assert key1 == key2
+
+    key3 = strategy.compute(test_func, (1, 2), {"c": 3})
+    key4 = strategy.compute(test_func, (1, 2), {"c": 3})
+    assert key3 == key4
+    assert key1 != key3
+
+
+class SlottedCallable:
+    __slots__ = ()
+
+    def __call__(self, a: Any) -> Any:
+        return a
+
+
+def test_inputs_strategy_with_non_weakrefable_callable():
+    """Test the Inputs strategy with a callable that can't be weakly referenced."""
+    strategy = Inputs()
+    func = SlottedCallable()
+
+    key1 = strategy.compute(func, (1,), {})
+    key2 = strategy.compute(func, (), {"a": 1})
+    assert key1 == key2
+
+
+def test_source_code_strategy_ignores_formatting():
+    """Test that comments and formatting don't change SourceCode keys."""
+    strategy = SourceCode()
+
+    def test_func(a: Any, b: Any) -> Any:
+        return a + b
+
+    key1 = strategy.compute(test_func, (), {})
+
+    def test_func(a: Any, b: Any) -> Any:
+        # Add the arguments
+
+        return (a +
+                b)  # fmt: skip
+
+    assert strategy.compute(test_func, (), {}) == key1
+
+    def test_func(a: Any, b: Any) -> Any:
+        return b + a
+
+    assert strategy.compute(test_func, (), {}) != key1
+
+
+def test_source_code_strategy_with_incomplete_source_lines():
+    """Test that source lines that don't parse on their own are hashed as text."""
+    strategy = SourceCode()
+    # fmt: off
+    funcs = [lambda a: a + 1,
+             lambda a: a + 2]
+    # fmt: on
+    assert strategy.compute(funcs[0], (), {}) != strategy.compute(funcs[1], (), {})
+
+
+def test_source_code_strategy_is_cached_per_function():
+    """Test that the SourceCode strategy only reads a function's source once."""
+    strategy = SourceCode()
+
+    def test_func(a: Any, b: Any) -> Any:
+        return a + b
+
+    key1 = strategy.compute(test_func, (), {})
+
+    with patch("inspect.getsource", side_effect=AssertionError("not cached")):
+        key2 = strategy.compute(test_func, (), {})
+
+    assert key1 == key2
+
+
+def test_compound_strategy_with_function_invariant_strategies():
+    """Test that function-invariant strategies are folded in once per function."""
+
+    def test_func(a: Any, b: Any) -> Any:
+        return a + b
+
+    compound = SourceCode() + Inputs()
+    key1 = compound.compute(test_func, (1, 2), {})
+
+    with patch.object(
+        SourceCode, "compute", side_effect=AssertionError("not precomputed")
+    ):
+        key2 = compound.compute(test_func, (1, 2), {})
+        key3 = compound.compute(test_func, (1, 3), {})
+
+    assert key1 == key2
+    assert key1 != key3
+    assert compound.func_invariant is False
+    assert (SourceCode() + SourceCode()).func_invariant is True
+
+
+def test_compound_strategy_feeds_a_single_hasher():
+    """Test that compound strategies feed each strategy into one hasher."""
+
+    class ConstantStrategy(MemoKeyStrategy):
+        def compute(self, func: Any, args: Any, kwargs: Any) -> str:  # noqa: ARG002
+            return "constant"
+
+    def test_func(a: Any, b: Any) -> Any:
+        return a + b
+
+    inputs = Inputs()
+    compound = inputs + ConstantStrategy()
+
+    expected = hashlib.blake2b(digest_size=16)
+    inputs.update(expected, test_func, (1, 2), {})
+    expected.update(b"constant")
+    assert compound.compute(test_func, (1, 2), {}) == expected.hexdigest()
+
+    # Nested compounds feed the same bytes as their flattened equivalent
+    hasher = hashlib.blake2b(digest_size=16)
+    compound.update(hasher, test_func, (1, 2), {})
+    assert hasher.hexdigest() == expected.hexdigest()
+
+
+def test_inputs_strategy_reuses_encoding_for_scalar_arguments():
+    """Test that scalar positional arguments are encoded once per function."""
+    inputs = Inputs()
+
+    def test_func(a: Any, b: Any = 1) -> Any:
+        return a + b
+
+    key1 = inputs.compute(test_func, (1,), {})
+    with patch.object(Inputs, "_encode", side_effect=AssertionError("not reused")):
+        assert inputs.compute(test_func, (1,), {}) == key1
+
+    # Equal scalars of different types still get different keys
+    assert inputs.compute(test_func, (True,), {}) != key1
+    assert inputs.compute(test_func, (1.0,), {}) != key1
+    # Equal floats that encode differently aren't confused
+    assert inputs.compute(test_func, (0.0,), {}) != inputs.compute(
+        test_func, (-0.0,), {}
+    )
+    # Keyword and non-scalar arguments are encoded on every call
+    assert inputs.compute(test_func, (), {"a": 1}) == key1
+    assert inputs.compute(test_func, ([1],), {}) != key1
+    assert inputs.compute(test_func, [1], {}) == key1
+
+
+def test_inputs_strategy_with_mutable_default():
+    """Test that encodings aren't reused when a default could be mutated."""
+    inputs = Inputs()
+
+    def test_func(a: Any, b: list[Any] = []) -> Any:  # noqa: B006
+        b.append(a)
+        return b
+
+    key1 = inputs.compute(test_func, (1,), {})
+    test_func(1)
+    assert inputs.compute(test_func, (1,), {}) != key1
+
+
+def test_inputs_strategy_bounds_reused_encodings():
+    """Test that the reused encodings are cleared once the cache is full."""
+    inputs = Inputs()
+
+    def test_func(a: Any) -> Any:
+        return a
+
+    with patch("stickynote.key_strategies._MAX_ENCODED_ARGUMENTS", 2):
+        keys = [inputs.compute(test_func, (n,), {}) for n in range(3)]
+        assert [inputs.compute(test_func, (n,), {}) for n in range(3)] == keys
+
+
+def test_compound_strategy_reuses_keys_for_scalar_arguments():
+    """Test that compound keys for scalar positional arguments are computed once."""
+    compound = SourceCode() + Inputs()
+
+    def test_func(a: Any, b: Any = 1) -> Any:
+        return a + b
+
+    key1 = compound.compute(test_func, (1,), {})
+    with patch.object(
+        CompoundMemoKeyStrategy, "_compute", side_effect=AssertionError("not reused")
+    ):
+        assert compound.compute(test_func, (1,), {}) == key1
+    assert compound.compute(test_func, (True,), {}) != key1
+    assert compound.compute(test_func, (0.0,), {}) != compound.compute(
+        test_func, (-0.0,), {}
+    )
+    assert compound.compute(test_func, (), {"a": 1}) == key1
+    assert compound.compute(test_func, ([1],), {}) != key1
+
+    # Other compounds don't share the reused keys
+    other = SourceCode() + Inputs() + Inputs()
+    assert other.compute(test_func, (1,), {}) != key1
+
+
+def test_compound_strategy_only_reuses_keys_of_plain_inputs():
+    """Test that keys aren't reused when other strategies depend on the call."""
+
+    class Counter(MemoKeyStrategy):
+        def __init__(self):
+            self.calls = 0
+
+        def compute(self, func: Any, args: Any, kwargs: Any) -> str:  # noqa: ARG002
+            self.calls += 1
+            return str(self.calls)
+
+    def test_func(a: Any) -> Any:
+        return a
+
+    compound = Inputs() + Counter()
+    assert compound.compute(test_func, (1,), {}) != compound.compute(
+        test_func, (1,), {}
+    )
+
+
+def test_scalar_caches_skip_long_arguments():
+    """Test that long string and bytes arguments aren't kept alive by the caches."""
+    compound = SourceCode() + Inputs()
+
+    def test_func(a: Any) -> Any:
+        return a
+
+    long_arg = "x" * 1000
+    key = compound.compute(test_func, (long_arg,), {})
+    assert compound.compute(test_func, (long_arg,), {}) == key
+    signature = _sig_cache[test_func]
+    assert not signature.encoded
+    assert not signature.keys
+
+    compound.compute(test_func, ("x",), {})
+    assert signature.encoded
+    assert signature.keys
+
+
+def test_compound_strategy_respects_overridden_compute():
+    """Test that subclasses overriding `compute` contribute their own keys."""
+
+    class FirstArgument(Inputs):
+        def compute(self, func: Any, args: Any, kwargs: Any) -> str:
+            return super().compute(func, args[:1], kwargs)
+
+    class SourceAndArguments(SourceCode):
+        def compute(self, func: Any, args: Any, kwargs: Any) -> str:  # ty: ignore[invalid-method-override]
+            return super().compute(func, args, kwargs) + repr(args)
+
+    class StillInvariant(SourceCode):
+        func_invariant = True
+
+        def compute(self, func: Any, args: Any, kwargs: Any) -> str:  # ty: ignore[invalid-method-override]
+            return super().compute(func, args, kwargs)
+
+    def test_func(a: Any, b: Any = 0) -> Any:
+        return a + b
+
+    compound = SourceCode() + FirstArgument()
+    assert compound.compute(test_func, (1, 2), {}) == compound.compute(
+        test_func, (1, 3), {}
+    )
+
+    assert not SourceAndArguments.func_invariant
+    assert StillInvariant.func_invariant
+    compound = CompoundMemoKeyStrategy(SourceAndArguments())
+    assert compound.compute(test_func, (1, 2), {}) != compound.compute(
+        test_func, (1, 3), {}
+    )
+
+
+def test_builtin_strategies_use_slots():
+    """Test that built-in strategies don't carry an instance dict."""
+    compound = SourceCode() + Inputs()
+    for strategy in (Inputs(), SourceCode(), compound, DEFAULT_STRATEGY):
+        assert not hasattr(strategy, "__dict__")
+    assert weakref.ref(compound)() is compound
+
+    class CustomInputs(Inputs):
+        pass
+
+    def test_func(a: Any) -> Any:
+        return a
+
+    custom = CustomInputs()
+    custom.note = "subclasses can still set attributes"  # ty: ignore[unresolved-attribute]
+    assert (compound + custom).compute(test_func, (1,), {})
+
+
+class TaggedCompound(CompoundMemoKeyStrategy):
+    pass
+
+
+def test_compound_strategy_round_trips_through_pickle():
+    """Test that compound strategies can be pickled after computing keys."""
+
+    def test_func(a: Any) -> Any:
+        return a
+
+    key = DEFAULT_STRATEGY.compute(test_func, (1,), {})
+    loaded = pickle.loads(pickle.dumps(DEFAULT_STRATEGY))
+    assert [type(strategy) for strategy in loaded.strategies] == [SourceCode, Inputs]
+    assert loaded.compute(test_func, (1,), {}) == key
+    assert loaded.compute(test_func, (2,), {}) == DEFAULT_STRATEGY.compute(
+        test_func, (2,), {}
+    )
+
+    tagged = TaggedCompound(Inputs())
+    tagged.tag = "kept"  # ty: ignore[unresolved-attribute]
+    loaded_tagged = pickle.loads(pickle.dumps(tagged))
+    assert loaded_tagged.tag == "kept"
+    assert loaded_tagged.compute(test_func, (1,), {}) == tagged.compute(
+        test_func, (1,), {}
+    )
@@ -3,9 +3,12 @@ from __future__ import annotations
 import asyncio
 import base64
 import importlib.util
+import math
 import pickle
+import weakref
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from time import sleep
 from typing import Any
 from unittest.mock import MagicMock
@@ -22,12 +25,18 @@ from stickynote.key_strategies import (
 )
 from stickynote.memoize import AsyncMemoBlock, MemoBlock
 from stickynote.serializers import (
+    MEMORY_SERIALIZER_CHAIN,
     CloudPickleSerializer,
     JsonSerializer,
     PickleSerializer,
     Serializer,
 )
-from stickynote.storage import MemoryStorage
+from stickynote.storage import (
+    FileStorage,
+    MemoryStorage,
+    MissingMemoError,
+    TieredStorage,
+)
 
 # Test CloudPickleSerializer only if cloudpickle is available
 HAS_CLOUDPICKLE = importlib.util.find_spec("cloudpickle") is not None
@@ -46,6 +55,48 @@ class Plebian:
         return self.x + y
 
 
+class DuckTypedStorage:
+    """
+    Storage that implements the required `MemoStorage` methods without inheriting
+    the protocol's default implementations.
+    """
+
+    def __init__(self, native: bool = False):
+        self.native = native
+        self.values: dict[str, Any] = {}
+
+    def exists(self, key: str, created_after: datetime | None = None) -> bool:  # noqa: ARG002
+        return key in self.values
+
+    async def exists_async(
+        self,
+        key: str,
+        created_after: datetime | None = None,  # noqa: ARG002
+    ) -> bool:
+        return key in self.values
+
+    def get(self, key: str, created_after: datetime | None = None) -> Any:  # noqa: ARG002
+        try:
+            return self.values[key]
+        except KeyError:
+            raise MissingMemoError(key) from None
+
+    async def get_async(self, key: str, created_after: datetime | None = None) -> Any:
+        return self.get(key, created_after)
+
+    def set(self, key: str, value: Any) -> None:
+        self.values[key] = value
+
+    async def set_async(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    async def delete_async(self, key: str) -> None:
+        self.delete(key)
+
+
 class TestMemoize:
     class TestSync:
         def test_basic_memoization(self):
@@ -67,6 +118,14 @@ class TestMemoize:
             assert result2 == 3
             assert call_count == 1  # Call count should not increase
 
+        def test_signed_zeros_are_memoized_separately(self):
+            @memoize(storage=MemoryStorage())
+            def sign(x: float) -> float:
+                return math.copysign(1.0, x)
+
+            assert sign(0.0) == 1.0
+            assert sign(-0.0) == -1.0
+
         def test_kwargs_memoization(self):
             storage = MemoryStorage()
             call_count = 0
@@ -492,6 +551,45 @@ class TestMemoize:
             memoized_add(1, 2)
             spy.assert_called_once_with("test_key", (1, 2), {})
 
+        def test_on_cache_hit_callbacks_share_timestamp(self):
+            storage = MemoryStorage()
+            spy1 = MagicMock()
+            spy2 = MagicMock()
+
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            memoized_add = memoize(storage=storage, key_strategy=StaticKeyStrategy())(
+                add
+            )
+            memoized_add.on_cache_hit(spy1)
+            memoized_add.on_cache_hit(spy2)
+
+            memoized_add(1, 2)
+            memoized_add(1, 2)
+            assert spy1.call_args.args[4] is spy2.call_args.args[4]
+
+        def test_callbacks_registered_after_first_call(self):
+            storage = MemoryStorage()
+            before_spy = MagicMock()
+            hit_spy = MagicMock()
+
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            memoized_add = memoize(storage=storage, key_strategy=StaticKeyStrategy())(
+                add
+            )
+
+            assert memoized_add(1, 2) == 3
+
+            memoized_add.before_cache_lookup(before_spy)
+            memoized_add.on_cache_hit(hit_spy)
+
+            assert memoized_add(1, 2) == 3
+            before_spy.assert_called_once_with("test_key", (1, 2), {})
+            hit_spy.assert_called_once()
+
         def test_with_max_age(self):
             storage = MemoryStorage()
             strategy = Inputs()
@@ -521,7 +619,219 @@ class TestMemoize:
             assert result == 3
             assert call_count == 2
 
+        def test_map(self):
+            storage = MemoryStorage()
+            call_count = 0
+
+            @memoize(storage=storage)
+            def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                return a + b
+
+            assert add(1, 2) == 3
+            assert call_count == 1
+
+            # Only the misses call the function, and duplicates are computed once
+            assert add.map([1, 2, 2], [2, 3, 3]) == [3, 5, 5]
+            assert call_count == 2
+            assert add(2, 3) == 5
+            assert call_count == 2
+
+        def test_map_with_callbacks(self):
+            storage = MemoryStorage(native=True)
+            before_spy = MagicMock()
+            hit_spy = MagicMock()
+
+            @memoize(storage=storage, key_strategy=StaticKeyStrategy())
+            def identity(a: int) -> int:
+                return a
+
+            identity.before_cache_lookup(before_spy)
+            identity.on_cache_hit(hit_spy)
+
+            assert identity.map([1]) == [1]
+            hit_spy.assert_not_called()
+            assert identity.map([2]) == [1]
+            assert before_spy.call_count == 2
+            hit_spy.assert_called_once()
+
+        def test_map_async_function(self):
+            @memoize(storage=MemoryStorage())
+            async def add(a: int, b: int) -> int:
+                return a + b
+
+            with pytest.raises(TypeError, match="not supported for async functions"):
+                add.map([1], [2])
+
+        def test_with_l1_size(self, tmp_path: Path):
+            storage = FileStorage(tmp_path)
+            call_count = 0
+
+            @memoize(storage=storage, l1_size=10)
+            def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                return a + b
+
+            assert isinstance(add.storage, TieredStorage)
+            assert add.storage.backend is storage
+            assert add(1, 2) == 3
+
+            # Hits are served in process even if the backing memo goes away
+            for path in tmp_path.iterdir():
+                path.unlink()
+            assert add(1, 2) == 3
+            assert call_count == 1
+
+        def test_memory_storage_defaults_to_pickle(self):
+            storage = MemoryStorage()
+
+            @memoize(storage=storage)
+            def pair(a: int, b: int) -> tuple[int, int]:
+                return (a, b)
+
+            assert pair(1, 2) == (1, 2)
+            # A cache hit round-trips the tuple instead of a JSON list
+            assert pair(1, 2) == (1, 2)
+            assert pair.serializer == MEMORY_SERIALIZER_CHAIN
+
+        def test_with_native_memory_storage(self):
+            storage = MemoryStorage(native=True)
+            serializer = MagicMock(spec=Serializer)
+            call_count = 0
+
+            @memoize(storage=storage, serializer=serializer)
+            def add_factory(a: int, b: int) -> Callable[[], int]:
+                nonlocal call_count
+                call_count += 1
+
+                def add() -> int:
+                    return a + b
+
+                return add
+
+            result1 = add_factory(1, 2)
+            result2 = add_factory(1, 2)
+            assert result1 is result2
+            assert result2() == 3
+            assert call_count == 1
+            serializer.serialize.assert_not_called()
+            serializer.deserialize.assert_not_called()
+
+        def test_with_native_memory_storage_and_max_age(self):
+            storage = MemoryStorage(native=True)
+
+            @memoize(storage=storage, max_age=timedelta(minutes=1))
+            def make_list(a: int) -> list[int]:
+                return [a]
+
+            assert make_list(1) is make_list(1)
+
+        def test_memoized_callable_wraps_function(self):
+            def add(a: int, b: int) -> int:
+                """Add two numbers."""
+                return a + b
+
+            memoized_add = memoize(storage=MemoryStorage())(add)
+            assert memoized_add.__name__ == "add"  # ty: ignore[unresolved-attribute]
+            assert memoized_add.__doc__ == "Add two numbers."
+            assert memoized_add.__wrapped__ is add  # ty: ignore[unresolved-attribute]
+            # Per-call attributes live in slots rather than the instance dict
+            assert "storage" not in memoized_add.__dict__
+            assert weakref.ref(memoized_add)() is memoized_add
+
+        @pytest.mark.skipif(not HAS_CLOUDPICKLE, reason="cloudpickle not installed")
+        def test_memoized_callable_round_trips_through_cloudpickle(self):
+            import cloudpickle
+
+            storage = DuckTypedStorage()
+
+            @memoize(storage=storage)
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            assert add(1, 2) == 3
+            loaded = cloudpickle.loads(cloudpickle.dumps(add))
+            assert loaded(1, 2) == 3
+            assert loaded(2, 3) == 5
+            assert loaded.storage.values.keys() > storage.values.keys()
+
+        def test_configuration_changes_after_decoration(self):
+            call_count = 0
+
+            @memoize(storage=MemoryStorage())
+            def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                return a + b
+
+            add(1, 2)
+            add.storage = storage = MemoryStorage()
+            add(1, 2)
+            assert call_count == 2
+            assert storage.cache
+
+            add.key_strategy = StaticKeyStrategy()
+            add(1, 2)
+            assert "test_key" in storage.cache
+
+            add.serializer = serializer = MagicMock(spec=Serializer)
+            serializer.serialize.return_value = "3"
+            add.key_strategy = Inputs()
+            add(2, 2)
+            serializer.serialize.assert_called_once_with(4)
+
+            add.max_age = timedelta(seconds=-1)
+            add(1, 2)
+            add(1, 2)
+            assert call_count == 6
+
+        def test_callbacks_appended_directly(self):
+            spy = MagicMock()
+
+            @memoize(storage=MemoryStorage(), key_strategy=StaticKeyStrategy())
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            add(1, 2)
+            add.on_cache_hit_callbacks.append(spy)
+            add(1, 2)
+            spy.assert_called_once()
+
+        @pytest.mark.parametrize("native", [False, True])
+        @pytest.mark.parametrize("l1_size", [None, 8])
+        def test_with_duck_typed_storage(self, native: bool, l1_size: int | None):
+            storage = DuckTypedStorage(native=native)
+            call_count = 0
+
+            @memoize(storage=storage, l1_size=l1_size)  # ty: ignore[invalid-argument-type]
+            def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                return a + b
+
+            assert add(1, 2) == 3
+            assert add(1, 2) == 3
+            assert call_count == 1
+            assert add.map([1, 2], [2, 3]) == [3, 5]
+            assert add.map([1, 2], [2, 3]) == [3, 5]
+            assert call_count == 2
+
     class TestAsync:
+        @pytest.mark.skipif(not HAS_CLOUDPICKLE, reason="cloudpickle not installed")
+        async def test_memoized_callable_round_trips_through_cloudpickle(self):
+            import cloudpickle
+
+            @memoize(storage=DuckTypedStorage())
+            async def add(a: int, b: int) -> int:
+                return a + b
+
+            assert await add(1, 2) == 3
+            loaded = cloudpickle.loads(cloudpickle.dumps(add))
+            assert await loaded(1, 2) == 3
+            assert await asyncio.gather(loaded(2, 3), loaded(2, 3)) == [5, 5]
+
         async def test_memoize_async_function(self):
             storage = MemoryStorage()
 
@@ -658,6 +968,158 @@ class TestMemoize:
             assert result == 3
             assert call_count == 2
 
+        async def test_with_native_memory_storage(self):
+            storage = MemoryStorage(native=True)
+            serializer = MagicMock(spec=Serializer)
+
+            @memoize(storage=storage, serializer=serializer)
+            async def make_list(a: int) -> list[int]:
+                return [a]
+
+            result1 = await make_list(1)
+            result2 = await make_list(1)
+            assert result1 is result2
+            serializer.serialize.assert_not_called()
+            serializer.deserialize.assert_not_called()
+
+        @pytest.mark.parametrize("l1_size", [None, 8])
+        async def test_with_duck_typed_storage(self, l1_size: int | None):
+            storage = DuckTypedStorage()
+            call_count = 0
+
+            @memoize(storage=storage, l1_size=l1_size)  # ty: ignore[invalid-argument-type]
+            async def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                return a + b
+
+            assert await add(1, 2) == 3
+            assert await add(1, 2) == 3
+            assert call_count == 1
+
+        async def test_concurrent_calls_are_coalesced(self):
+            storage = MemoryStorage()
+            call_count = 0
+
+            @memoize(storage=storage)
+            async def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                await asyncio.sleep(0.01)
+                return a + b
+
+            results = await asyncio.gather(*(add(1, 2) for _ in range(10)))
+            assert results == [3] * 10
+            assert call_count == 1
+
+            # Different keys are not coalesced
+            assert await asyncio.gather(add(1, 2), add(2, 3)) == [3, 5]
+            assert call_count == 2
+
+        async def test_coalesced_calls_retry_after_failure(self):
+            storage = MemoryStorage()
+            call_count = 0
+
+            @memoize(storage=storage)
+            async def flaky(a: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                await asyncio.sleep(0.01)
+                if call_count == 1:
+                    raise ValueError("first call fails")
+                return a
+
+            results = await asyncio.gather(
+                *(flaky(1) for _ in range(3)), return_exceptions=True
+            )
+            assert isinstance(results[0], ValueError)
+            assert results[1:] == [1, 1]
+            # The waiting calls each resolve the key themselves
+            assert call_count == 3
+
+        async def test_coalesced_failures_are_retried_concurrently(self):
+            storage = MemoryStorage()
+            call_count = 0
+
+            @memoize(storage=storage)
+            async def failing(a: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                await asyncio.sleep(0.05)
+                raise ValueError(a)
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            results = await asyncio.gather(
+                *(failing(1) for _ in range(10)), return_exceptions=True
+            )
+            elapsed = loop.time() - start
+            assert all(isinstance(result, ValueError) for result in results)
+            assert call_count == 10
+            # One failed call followed by all the waiters at once, not ten in a row
+            assert elapsed < 0.25
+
+        async def test_cancelled_waiter_does_not_cancel_coalesced_call(self):
+            storage = MemoryStorage()
+
+            @memoize(storage=storage)
+            async def add(a: int, b: int) -> int:
+                await asyncio.sleep(0.01)
+                return a + b
+
+            leader = asyncio.ensure_future(add(1, 2))
+            waiter = asyncio.ensure_future(add(1, 2))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            assert await leader == 3
+            assert waiter.cancelled()
+
+        async def test_coalesced_calls_get_their_own_copies(self):
+            storage = MemoryStorage()
+
+            @memoize(storage=storage)
+            async def make_list(a: int) -> list[int]:
+                await asyncio.sleep(0.01)
+                return [a]
+
+            # Both when the result is computed and when it is loaded
+            for _ in range(2):
+                first, second = await asyncio.gather(make_list(1), make_list(1))
+                assert first == second == [1]
+                assert first is not second
+
+        async def test_coalesced_calls_share_native_values(self):
+            storage = MemoryStorage(native=True)
+
+            @memoize(storage=storage)
+            async def make_list(a: int) -> list[int]:
+                await asyncio.sleep(0.01)
+                return [a]
+
+            first, second = await asyncio.gather(make_list(1), make_list(1))
+            assert first is second
+
+        async def test_coalesced_calls_with_callbacks(self):
+            storage = MemoryStorage()
+            spy = MagicMock()
+            call_count = 0
+
+            @memoize(storage=storage, key_strategy=StaticKeyStrategy())
+            async def add(a: int, b: int) -> int:
+                nonlocal call_count
+                call_count += 1
+                await asyncio.sleep(0.01)
+                return a + b
+
+            add.on_cache_hit(spy)
+
+            assert await asyncio.gather(add(1, 2), add(1, 2)) == [3, 3]
+            assert call_count == 1
+            spy.assert_not_called()
+
+            assert await asyncio.gather(add(1, 2), add(1, 2)) == [3, 3]
+            assert spy.call_count == 2
+
 
 class TestMemoBlock:
     def test_context_manager(self):
@@ -685,6 +1147,12 @@ class TestMemoBlock:
             assert not memo.hit
             assert memo.value is None
 
+    def test_save_without_staged_value(self):
+        storage = MemoryStorage()
+
+        MemoBlock(key="test_key", storage=storage).save()
+        assert not storage.exists("test_key")
+
     def test_save_value(self):
         storage = MemoryStorage()
         test_value = {"key": "value"}
@@ -810,6 +1278,36 @@ class TestMemoBlock:
 
         assert len(e.value.exceptions) == 1
 
+    def test_all_deserialization_attempts_fail_with_chain(self):
+        storage = MemoryStorage()
+        storage.set("test_key", "not valid json or pickle")
+
+        with (
+            pytest.raises(ExceptionGroup) as e,
+            MemoBlock(
+                key="test_key",
+                storage=storage,
+                serializer=(JsonSerializer(), PickleSerializer()),
+            ),
+        ):
+            pass
+
+        assert len(e.value.exceptions) == 2
+
+    def test_single_serializer_fails_to_serialize(self):
+        storage = MemoryStorage()
+
+        with (
+            pytest.raises(ExceptionGroup) as e,
+            MemoBlock(
+                key="test_key", storage=storage, serializer=JsonSerializer()
+            ) as memo,
+        ):
+            memo.stage(Plebian(1))
+
+        assert len(e.value.exceptions) == 1
+        assert not storage.exists("test_key")
+
 
 class TestAsyncMemoBlock:
     async def test_context_manager(self):
@@ -830,6 +1328,14 @@ class TestAsyncMemoBlock:
             assert memo.hit
             assert memo.value == test_value
 
+    async def test_load_native_value(self):
+        storage = MemoryStorage(native=True)
+        value = [1]
+        await storage.set_async("test_key", value)  # ty: ignore[invalid-argument-type]
+        async with AsyncMemoBlock(key="test_key", storage=storage) as memo:
+            assert memo.hit
+            assert memo.value is value
+
     async def test_load_nonexistent_value(self):
         storage = MemoryStorage()
         async with AsyncMemoBlock(key="nonexistent_key", storage=storage) as memo:
@@ -837,6 +1343,12 @@ class TestAsyncMemoBlock:
             assert not memo.hit
             assert memo.value is None
 
+    async def test_save_without_staged_value(self):
+        storage = MemoryStorage()
+
+        await AsyncMemoBlock(key="test_key", storage=storage).save()
+        assert not storage.exists("test_key")
+
     async def test_save_value(self):
         storage = MemoryStorage()
         test_value = {"key": "value"}
@@ -401,6 +401,29 @@ class TestReplayEdgeCases:
         assert call_counts["fn_with_unhashable"] == 1
 
 
+class TestReplayKeys:
+    def test_argument_hashes_are_stable(self):
+        """Replay keys keep the encoding used by earlier versions."""
+        from stickynote.replay import _hash_arguments
+
+        assert (
+            _hash_arguments(fetch_user, (1,), {})
+            == hashlib.sha256(
+                json.dumps({"user_id": 1}, sort_keys=True).encode()
+            ).hexdigest()
+        )
+
+    def test_argument_hashes_fall_back_to_pickle(self):
+        import pickle
+
+        from stickynote.replay import _hash_arguments
+
+        assert (
+            _hash_arguments(fetch_user, ({1},), {})
+            == hashlib.sha256(pickle.dumps({"user_id": {1}}, protocol=4)).hexdigest()
+        )
+
+
 class TestReplayEnvelopeFormat:
     def setup_method(self):
         call_counts.clear()
@@ -4,16 +4,21 @@ import base64
 import importlib.util
 import json
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from stickynote.serializers import (
     DEFAULT_SERIALIZER_CHAIN,
+    MEMORY_SERIALIZER_CHAIN,
     CloudPickleSerializer,
+    CompressedSerializer,
     JsonSerializer,
     PickleSerializer,
+    serializer_for,
 )
+from stickynote.storage import FileStorage, MemoryStorage
 
 
 def test_json_serializer():
@@ -123,8 +128,9 @@ def test_cloudpickle_serializer():
     assert deserialized["lambda"](5) == test_data["lambda"](5)
 
 
-@pytest.mark.skipif(HAS_CLOUDPICKLE, reason="cloudpickle is installed")
-def test_cloudpickle_serializer_import_error():
+def test_cloudpickle_serializer_import_error(monkeypatch: pytest.MonkeyPatch):
+    # The import is attempted once, when the serializers module is loaded
+    monkeypatch.setattr("stickynote.serializers.cloudpickle", None)
     serializer = CloudPickleSerializer()
 
     with pytest.raises(ImportError) as excinfo:
@@ -138,3 +144,46 @@ def test_cloudpickle_serializer_import_error():
 
     assert "Unable to import cloudpickle" in str(excinfo.value)
     assert "install 'stickynote[cloudpickle]'" in str(excinfo.value)
+
+
+def test_serializer_for_storage(tmp_path: Path):
+    assert serializer_for(MemoryStorage()) == MEMORY_SERIALIZER_CHAIN
+    assert isinstance(serializer_for(MemoryStorage())[0], PickleSerializer)
+    assert serializer_for(FileStorage(tmp_path)) == DEFAULT_SERIALIZER_CHAIN
+
+
+def test_json_serializer_rejects_unsupported_types():
+    serializer = JsonSerializer()
+
+    with pytest.raises(TypeError, match="Object of type set is not JSON serializable"):
+        serializer.serialize({1, 2})
+    # Subclasses of supported types are still encoded
+    assert serializer.serialize(True) == "true"
+    assert serializer.serialize(None) == "null"
+
+
+def test_compressed_serializer():
+    serializer = CompressedSerializer(JsonSerializer())
+
+    large = {"values": ["repeated"] * 100}
+    serialized = serializer.serialize(large)
+    assert len(serialized) < len(json.dumps(large))
+    assert serializer.deserialize(serialized) == large
+
+    # Small results are stored as is
+    assert serializer.serialize({"a": 1}) == '={"a": 1}'
+    assert serializer.deserialize('={"a": 1}') == {"a": 1}
+
+
+def test_compressed_serializer_skips_incompressible_results():
+    serializer = CompressedSerializer(PickleSerializer(), min_size=0)
+    data = base64.b64encode(bytes(range(256))).decode()
+    serialized = serializer.serialize(data)
+    assert serialized.startswith("=")
+    assert serializer.deserialize(serialized) == data
+
+
+def test_compressed_serializer_rejects_unknown_data():
+    serializer = CompressedSerializer(JsonSerializer())
+    with pytest.raises(ValueError, match="not written by CompressedSerializer"):
+        serializer.deserialize('{"a": 1}')
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from stickynote.storage import MISSING, MemoStorage, MissingMemoError
+from stickynote.storage.base import ExpiredMemoError, _get_many_async, _set_many_async
+
+
+class DictStorage(MemoStorage):
+    """
+    Minimal storage that only implements the required protocol methods.
+    """
+
+    def __init__(self):
+        self.values: dict[str, tuple[str, datetime]] = {}
+
+    def exists(self, key: str, created_after: datetime | None = None) -> bool:
+        try:
+            self.get(key, created_after)
+        except MissingMemoError:
+            return False
+        return True
+
+    async def exists_async(
+        self, key: str, created_after: datetime | None = None
+    ) -> bool:
+        return self.exists(key, created_after)
+
+    def get(self, key: str, created_after: datetime | None = None) -> str:
+        if key not in self.values:
+            raise MissingMemoError(key)
+        value, created_at = self.values[key]
+        if created_after is not None and created_at < created_after:
+            raise ExpiredMemoError(key)
+        return value
+
+    async def get_async(self, key: str, created_after: datetime | None = None) -> str:
+        return self.get(key, created_after)
+
+    def set(self, key: str, value: str) -> None:
+        self.values[key] = (value, datetime.now(timezone.utc))
+
+    async def set_async(self, key: str, value: str) -> None:
+        self.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    async def delete_async(self, key: str) -> None:
+        self.delete(key)
+
+
+class TestMemoStorageDefaults:
+    @pytest.fixture
+    def storage(self):
+        storage = DictStorage()
+        storage.set("test", "test")
+        return storage
+
+    def test_get_or_miss(self, storage: DictStorage):
+        assert storage.get_or_miss("test") == "test"
+        assert storage.get_or_miss("nonexistent") is MISSING
+        assert (
+            storage.get_or_miss(
+                "test",
+                created_after=datetime.now(timezone.utc) + timedelta(seconds=10),
+            )
+            is MISSING
+        )
+
+    async def test_get_or_miss_async(self, storage: DictStorage):
+        assert await storage.get_or_miss_async("test") == "test"
+        assert await storage.get_or_miss_async("nonexistent") is MISSING
+
+    def test_many(self, storage: DictStorage):
+        storage.set_many({"a": "1", "b": "2"})
+        assert storage.get_many(["a", "b", "nonexistent"]) == ["1", "2", MISSING]
+
+    async def test_many_async(self, storage: DictStorage):
+        await storage.set_many_async({"a": "1", "b": "2"})
+        assert await storage.get_many_async(["a", "b", "nonexistent"]) == [
+            "1",
+            "2",
+            MISSING,
+        ]
+
+
+class MinimalStorage:
+    """
+    Storage that implements the required protocol methods without inheriting the
+    defaults of the optional ones.
+    """
+
+    def __init__(self):
+        self.storage = DictStorage()
+
+    def get(self, key: str, created_after: datetime | None = None) -> str:
+        return self.storage.get(key, created_after)
+
+    async def get_async(self, key: str, created_after: datetime | None = None) -> str:
+        return self.storage.get(key, created_after)
+
+    def set(self, key: str, value: str) -> None:
+        self.storage.set(key, value)
+
+    async def set_async(self, key: str, value: str) -> None:
+        self.storage.set(key, value)
+
+
+class TestHelpers:
+    async def test_batch_helpers_fall_back_to_defaults(self):
+        storage = MinimalStorage()
+        await _set_many_async(storage, {"a": "1"})  # ty: ignore[invalid-argument-type]
+        values = await _get_many_async(storage, ["a", "b"])  # ty: ignore[invalid-argument-type]
+        assert values == ["1", MISSING]
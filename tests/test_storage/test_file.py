@@ -1,9 +1,12 @@
+import pickle
+import threading
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from stickynote.storage import FileStorage, MissingMemoError
+from stickynote.storage import MISSING, FileStorage, MissingMemoError
 from stickynote.storage.base import ExpiredMemoError
 
 
@@ -25,6 +28,11 @@ class TestFileStorage:
     def test_custom_path(self, tmp_path: Path):
         assert FileStorage(tmp_path).path == tmp_path
 
+    def test_change_path(self, storage: FileStorage, tmp_path: Path):
+        storage.path = tmp_path / "other"
+        storage.set("test", "test")
+        assert (tmp_path / "other" / "test").read_text() == "test"
+
     def test_exists(self, storage: FileStorage, existing_file: Path):
         assert storage.exists(existing_file.name)
 
@@ -121,3 +129,136 @@ class TestFileStorage:
 
     async def test_delete_async_nonexistent(self, storage: FileStorage):
         await storage.delete_async("nonexistent")  # Should not raise
+
+    def test_get_or_miss(self, storage: FileStorage, existing_file: Path):
+        assert storage.get_or_miss(existing_file.name) == "test"
+        assert storage.get_or_miss("nonexistent") is MISSING
+        assert (
+            storage.get_or_miss(
+                existing_file.name,
+                created_after=datetime.now(timezone.utc) + timedelta(microseconds=1),
+            )
+            is MISSING
+        )
+
+    async def test_get_or_miss_async(self, storage: FileStorage, existing_file: Path):
+        assert await storage.get_or_miss_async(existing_file.name) == "test"
+        assert await storage.get_or_miss_async("nonexistent") is MISSING
+        assert (
+            await storage.get_or_miss_async(
+                existing_file.name,
+                created_after=datetime.now(timezone.utc) - timedelta(seconds=10),
+            )
+            == "test"
+        )
+
+    def test_get_many(self, storage: FileStorage, existing_file: Path):
+        assert storage.get_many([existing_file.name, "nonexistent"]) == [
+            "test",
+            MISSING,
+        ]
+
+    async def test_get_many_async(self, storage: FileStorage, existing_file: Path):
+        assert await storage.get_many_async([existing_file.name, "nonexistent"]) == [
+            "test",
+            MISSING,
+        ]
+
+    def test_set_many(self, storage: FileStorage):
+        storage.set_many({"a": "1", "b": "2"})
+        assert storage.get_many(["a", "b"]) == ["1", "2"]
+
+    async def test_set_many_async(self, storage: FileStorage):
+        await storage.set_many_async({"a": "1", "b": "2"})
+        assert await storage.get_many_async(["a", "b"]) == ["1", "2"]
+
+    async def test_many_async_use_one_thread_hop(
+        self, storage: FileStorage, monkeypatch: pytest.MonkeyPatch
+    ):
+        hops: list[str] = []
+        run = storage._run
+
+        async def counting_run(fn, *args):
+            hops.append(fn.__name__)
+            return await run(fn, *args)
+
+        monkeypatch.setattr(storage, "_run", counting_run)
+        await storage.set_many_async({"a": "1", "b": "2", "c": "3"})
+        assert await storage.get_many_async(["a", "b", "c", "d"]) == [
+            "1",
+            "2",
+            "3",
+            MISSING,
+        ]
+        assert hops == ["set_many", "get_many"]
+
+    async def test_async_io_runs_on_storage_threads(
+        self, storage: FileStorage, existing_file: Path
+    ):
+        thread_names: list[str] = []
+
+        def read(key: str, created_after: datetime | None) -> str:
+            thread_names.append(threading.current_thread().name)
+            return FileStorage.get(storage, key, created_after)
+
+        storage.get = read  # ty: ignore[invalid-assignment]
+        assert await storage.get_async(existing_file.name) == "test"
+        assert thread_names[0].startswith("stickynote-file")
+
+    async def test_round_trips_through_pickle(
+        self, storage: FileStorage, existing_file: Path
+    ):
+        # Use the executor first so the copies have to leave it out
+        assert await storage.get_async(existing_file.name) == "test"
+        for copy in (pickle.loads(pickle.dumps(storage)), deepcopy(storage)):
+            assert copy.path == storage.path
+            assert await copy.get_async(existing_file.name) == "test"
+            assert copy._executor is not storage._executor
+
+    def test_set_writes_atomically(self, storage: FileStorage):
+        storage.set("test", "first")
+        storage.set("test", "second")
+        assert storage.get("test") == "second"
+        # Only the memo itself is left behind, no temporary files
+        assert [path.name for path in storage.path.iterdir()] == ["test"]
+
+    def test_set_recreates_deleted_directory(self, storage: FileStorage):
+        storage.set("test", "test")
+        (storage.path / "test").unlink()
+        storage.path.rmdir()
+        storage.set("test", "test")
+        assert storage.get("test") == "test"
+
+    def test_failed_set_cleans_up(self, storage: FileStorage, existing_file: Path):
+        with pytest.raises(TypeError):
+            storage.set("test", 1)  # ty: ignore[invalid-argument-type]
+        assert storage.get("test") == "test"
+        assert [path.name for path in storage.path.iterdir()] == [existing_file.name]
+
+
+class TestShardedFileStorage:
+    @pytest.fixture
+    def storage(self, tmp_path: Path):
+        return FileStorage(tmp_path / ".stickynote", shard=True)
+
+    def test_set_and_get(self, storage: FileStorage):
+        storage.set("abcdef", "test")
+        assert (storage.path / "ab" / "cd" / "abcdef").read_text() == "test"
+        assert storage.get("abcdef") == "test"
+        assert storage.get_or_miss("abcdef") == "test"
+        assert storage.exists("abcdef")
+
+    def test_get_nonexistent(self, storage: FileStorage):
+        with pytest.raises(MissingMemoError):
+            storage.get("abcdef")
+        assert storage.get_or_miss("abcdef") is MISSING
+        assert not storage.exists("abcdef")
+
+    def test_delete(self, storage: FileStorage):
+        storage.set("abcdef", "test")
+        storage.delete("abcdef")
+        assert not storage.exists("abcdef")
+
+    async def test_set_and_get_async(self, storage: FileStorage):
+        await storage.set_async("abcdef", "test")
+        assert await storage.get_async("abcdef") == "test"
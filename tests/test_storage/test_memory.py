@@ -1,8 +1,12 @@
+import pickle
+import threading
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from freezegun import freeze_time
 
-from stickynote.storage import MemoryStorage, MissingMemoError
+from stickynote.storage import MISSING, MemoryStorage, MissingMemoError
 from stickynote.storage.base import ExpiredMemoError
 
 
@@ -115,3 +119,134 @@ class TestMemoryStorage:
 
     async def test_delete_async_nonexistent(self, storage: MemoryStorage):
         await storage.delete_async("nonexistent")  # Should not raise
+
+    def test_maxsize_evicts_least_recently_used(self):
+        storage = MemoryStorage(maxsize=2)
+        storage.set("a", "1")
+        storage.set("b", "2")
+
+        # Reading "a" makes "b" the least recently used memo
+        assert storage.get("a") == "1"
+        storage.set("c", "3")
+
+        assert storage.exists("a")
+        assert not storage.exists("b")
+        assert storage.exists("c")
+        assert "b" not in storage.metadata
+
+    async def test_maxsize_evicts_least_recently_used_async(self):
+        storage = MemoryStorage(maxsize=1)
+        await storage.set_async("a", "1")
+        await storage.set_async("b", "2")
+
+        assert not await storage.exists_async("a")
+        assert await storage.get_async("b") == "2"
+
+    def test_set_existing_key_refreshes_recency(self):
+        storage = MemoryStorage(maxsize=2)
+        storage.set("a", "1")
+        storage.set("b", "2")
+        storage.set("a", "3")
+        storage.set("c", "4")
+
+        assert storage.get("a") == "3"
+        assert not storage.exists("b")
+
+    def test_get_or_miss(self, storage: MemoryStorage, existing_key: str):
+        assert storage.get_or_miss(existing_key) == "test"
+        assert storage.get_or_miss("nonexistent") is MISSING
+        assert (
+            storage.get_or_miss(
+                existing_key,
+                created_after=datetime.now(timezone.utc) + timedelta(microseconds=1),
+            )
+            is MISSING
+        )
+
+    def test_missing_repr(self):
+        assert repr(MISSING) == "MISSING"
+
+    async def test_get_or_miss_async(self, storage: MemoryStorage, existing_key: str):
+        assert await storage.get_or_miss_async(existing_key) == "test"
+        assert await storage.get_or_miss_async("nonexistent") is MISSING
+
+    def test_get_many(self, storage: MemoryStorage, existing_key: str):
+        assert storage.get_many([existing_key, "nonexistent"]) == ["test", MISSING]
+
+    async def test_get_many_async(self, storage: MemoryStorage, existing_key: str):
+        assert await storage.get_many_async([existing_key, "nonexistent"]) == [
+            "test",
+            MISSING,
+        ]
+
+    def test_set_many(self, storage: MemoryStorage):
+        storage.set_many({"a": "1", "b": "2"})
+        assert storage.get("a") == "1"
+        assert storage.get("b") == "2"
+
+    async def test_set_many_async(self, storage: MemoryStorage):
+        await storage.set_many_async({"a": "1", "b": "2"})
+        assert await storage.get_many_async(["a", "b"]) == ["1", "2"]
+
+    def test_purge_expired(self, storage: MemoryStorage):
+        with freeze_time("2025-01-01"):
+            storage.set("old", "1")
+        with freeze_time("2025-01-03"):
+            storage.set("new", "2")
+            storage.set("reset", "3")
+        with freeze_time("2025-01-01"):
+            storage.set("reset", "4")
+
+        assert storage.purge_expired(datetime(2025, 1, 2, tzinfo=timezone.utc)) == 2
+        assert storage.get_many(["old", "new", "reset"]) == [MISSING, "2", MISSING]
+        assert storage.cache.keys() == storage.metadata.keys() == {"new"}
+        assert storage.purge_expired(datetime(2025, 1, 2, tzinfo=timezone.utc)) == 0
+
+    def test_round_trips_through_pickle(self, existing_key: str):
+        storage = MemoryStorage(maxsize=2)
+        storage.set(existing_key, "test")
+        for copy in (pickle.loads(pickle.dumps(storage)), deepcopy(storage)):
+            assert copy.get(existing_key) == "test"
+            assert copy.maxsize == 2
+            copy.set("other", "value")
+            assert copy._write_lock is not storage._write_lock
+        assert not storage.exists("other")
+
+    def test_key_evicted_during_read_is_a_miss(self):
+        storage = MemoryStorage(maxsize=1)
+        storage.set("test", "test")
+
+        # Simulate a concurrent eviction that has removed the metadata
+        del storage.metadata["test"]
+        assert (
+            storage.get_or_miss(
+                "test",
+                created_after=datetime.now(timezone.utc) - timedelta(seconds=10),
+            )
+            is MISSING
+        )
+        storage._touch("nonexistent")  # Should not raise
+
+    def test_concurrent_writes_and_reads(self):
+        storage = MemoryStorage(maxsize=10)
+        errors: list[Exception] = []
+
+        def worker(offset: int):
+            try:
+                for i in range(500):
+                    key = str((i + offset) % 20)
+                    storage.set(key, key)
+                    storage.get_or_miss(key)
+                    storage.delete(str(i % 20))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(storage.cache) <= 10
+        assert storage.cache.keys() == storage.metadata.keys()
@@ -9,7 +9,7 @@ from typing import Any
 
 import pytest
 
-from stickynote.storage import MissingMemoError, RedisStorage
+from stickynote.storage import MISSING, MissingMemoError, RedisStorage
 from stickynote.storage.base import ExpiredMemoError
 
 REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
@@ -110,6 +110,66 @@ class TestRedisStorage:
         with pytest.raises(ExpiredMemoError):
             await storage.get_async(key)
 
+    def test_get_or_miss(self, storage: RedisStorage, existing_key: str):
+        assert storage.get_or_miss(existing_key) == "test"
+        assert storage.get_or_miss("nonexistent") is MISSING
+        assert (
+            storage.get_or_miss(
+                existing_key,
+                created_after=datetime.now(timezone.utc) + timedelta(microseconds=1),
+            )
+            is MISSING
+        )
+
+    def test_get_or_miss_with_missing_created_at(self, storage: RedisStorage):
+        key = "test-without-created-at"
+        storage.client.set(f"stickynote:{key}", "test")
+        assert storage.get_or_miss(key) is MISSING
+
+    async def test_get_or_miss_async(self, storage: RedisStorage, existing_key: str):
+        assert await storage.get_or_miss_async(existing_key) == "test"
+        assert await storage.get_or_miss_async("nonexistent") is MISSING
+        assert (
+            await storage.get_or_miss_async(
+                existing_key,
+                created_after=datetime.now(timezone.utc) + timedelta(microseconds=1),
+            )
+            is MISSING
+        )
+
+    def test_get_many(self, storage: RedisStorage, existing_key: str):
+        storage.client.set("stickynote:no-created-at", "test")
+        assert storage.get_many([existing_key, "nonexistent", "no-created-at"]) == [
+            "test",
+            MISSING,
+            MISSING,
+        ]
+        assert storage.get_many(
+            [existing_key],
+            created_after=datetime.now(timezone.utc) + timedelta(microseconds=1),
+        ) == [MISSING]
+        assert storage.get_many([]) == []
+
+    async def test_get_many_async(self, storage: RedisStorage, existing_key: str):
+        assert await storage.get_many_async([existing_key, "nonexistent"]) == [
+            "test",
+            MISSING,
+        ]
+        assert await storage.get_many_async([]) == []
+
+    def test_set_many(self, storage: RedisStorage):
+        storage.set_many({"a": "1", "b": "2"})
+        storage.set_many({})
+        assert storage.get_many(
+            ["a", "b"],
+            created_after=datetime.now(timezone.utc) - timedelta(seconds=10),
+        ) == ["1", "2"]
+
+    async def test_set_many_async(self, storage: RedisStorage):
+        await storage.set_many_async({"a": "1", "b": "2"})
+        await storage.set_many_async({})
+        assert await storage.get_many_async(["a", "b"]) == ["1", "2"]
+
     def test_set(self, storage: RedisStorage):
         storage.set("test", "test")
         assert storage.get("test") == "test"
@@ -118,6 +178,47 @@ class TestRedisStorage:
         await storage.set_async("test", "test")
         assert await storage.get_async("test") == "test"
 
+    def test_ttl(self):
+        storage = RedisStorage(db=15, ttl=timedelta(minutes=1))
+        storage.set("test", "test")
+        storage.set_many({"a": "1", "b": "2"})
+        storage.set_many({})
+        for key in ("test", "a", "b"):
+            assert 0 < storage.client.ttl(storage._key(key)) <= 60
+            assert 0 < storage.client.ttl(storage._created_at_key(key)) <= 60
+        assert storage.get_many(["test", "a", "b"]) == ["test", "1", "2"]
+
+    async def test_ttl_async(self):
+        storage = RedisStorage(db=15, ttl=timedelta(minutes=1))
+        await storage.set_async("test", "test")
+        await storage.set_many_async({"a": "1", "b": "2"})
+        await storage.set_many_async({})
+        for key in ("test", "a", "b"):
+            assert 0 < await storage.async_client.ttl(storage._key(key)) <= 60
+            assert (
+                0 < await storage.async_client.ttl(storage._created_at_key(key)) <= 60
+            )
+        assert await storage.get_many_async(["test", "a", "b"]) == ["test", "1", "2"]
+
+    @pytest.mark.parametrize(
+        "ttl", [timedelta(0), timedelta(seconds=-1), timedelta(milliseconds=500)]
+    )
+    def test_invalid_ttl(self, ttl: timedelta):
+        with pytest.raises(ValueError, match="ttl must be at least one second"):
+            RedisStorage(ttl=ttl)
+
+    def test_no_ttl(self, storage: RedisStorage, existing_key: str):
+        assert storage.client.ttl(storage._key(existing_key)) == -1
+
+    def test_clients_are_created_on_first_use(self):
+        storage = RedisStorage(db=15)
+        assert "client" not in vars(storage)
+        assert "async_client" not in vars(storage)
+        storage.set("test", "test")
+        assert "client" in vars(storage)
+        assert "async_client" not in vars(storage)
+        assert storage.client is storage.client
+
     def test_prefix(self, storage: RedisStorage):
         # Test that keys are properly prefixed
         storage.set("test", "value")
@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from stickynote.storage import (
+    MISSING,
+    FileStorage,
+    MemoryStorage,
+    MissingMemoError,
+    TieredStorage,
+)
+from stickynote.storage.base import ExpiredMemoError
+
+
+class TestTieredStorage:
+    @pytest.fixture
+    def backend(self, tmp_path: Path):
+        return FileStorage(tmp_path / ".stickynote")
+
+    @pytest.fixture
+    def storage(self, backend: FileStorage):
+        return TieredStorage(backend, maxsize=2)
+
+    @pytest.fixture
+    def existing_key(self, storage: TieredStorage):
+        storage.set("test", "test")
+        return "test"
+
+    @pytest.fixture
+    def backend_key(self, backend: FileStorage):
+        backend.set("backend", "backend")
+        return "backend"
+
+    def test_native_follows_backend(self):
+        assert not TieredStorage(MemoryStorage()).native
+        storage = TieredStorage(MemoryStorage(native=True))
+        assert storage.native
+        assert storage.l1.native
+
+    def test_set_writes_both_tiers(
+        self, storage: TieredStorage, backend: FileStorage, existing_key: str
+    ):
+        assert storage.l1.get(existing_key) == "test"
+        assert backend.get(existing_key) == "test"
+
+    async def test_set_async_writes_both_tiers(
+        self, storage: TieredStorage, backend: FileStorage
+    ):
+        await storage.set_async("test", "test")
+        assert storage.l1.get("test") == "test"
+        assert await backend.get_async("test") == "test"
+
+    def test_exists(self, storage: TieredStorage, existing_key: str, backend_key: str):
+        assert storage.exists(existing_key)
+        assert storage.exists(backend_key)
+        assert not storage.exists("nonexistent")
+
+    async def test_exists_async(
+        self, storage: TieredStorage, existing_key: str, backend_key: str
+    ):
+        assert await storage.exists_async(existing_key)
+        assert await storage.exists_async(backend_key)
+        assert not await storage.exists_async("nonexistent")
+
+    def test_get_uses_in_process_cache(
+        self, storage: TieredStorage, backend: FileStorage, existing_key: str
+    ):
+        (backend.path / existing_key).unlink()
+        assert storage.get(existing_key) == "test"
+        assert storage.get_or_miss(existing_key) == "test"
+
+    async def test_get_async_uses_in_process_cache(
+        self, storage: TieredStorage, backend: FileStorage, existing_key: str
+    ):
+        (backend.path / existing_key).unlink()
+        assert await storage.get_async(existing_key) == "test"
+        assert await storage.get_or_miss_async(existing_key) == "test"
+
+    def test_get_reads_through_backend(self, storage: TieredStorage, backend_key: str):
+        assert storage.get(backend_key) == "backend"
+        assert storage.l1.get(backend_key) == "backend"
+
+    async def test_get_async_reads_through_backend(
+        self, storage: TieredStorage, backend_key: str
+    ):
+        assert await storage.get_async(backend_key) == "backend"
+        assert storage.l1.get(backend_key) == "backend"
+
+    def test_get_or_miss_reads_through_backend(
+        self, storage: TieredStorage, backend_key: str
+    ):
+        assert storage.get_or_miss(backend_key) == "backend"
+        assert storage.l1.get(backend_key) == "backend"
+        assert storage.get_or_miss("nonexistent") is MISSING
+
+    async def test_get_or_miss_async_reads_through_backend(
+        self, storage: TieredStorage, backend_key: str
+    ):
+        assert await storage.get_or_miss_async(backend_key) == "backend"
+        assert storage.l1.get(backend_key) == "backend"
+        assert await storage.get_or_miss_async("nonexistent") is MISSING
+
+    def test_read_through_memos_do_not_satisfy_cutoffs(
+        self, storage: TieredStorage, backend: FileStorage, backend_key: str
+    ):
+        assert storage.get(backend_key) == "backend"
+        (backend.path / backend_key).unlink()
+
+        # The copied memo's creation time is unknown, so a cutoff goes to the backend
+        created_after = datetime.now(timezone.utc) - timedelta(seconds=10)
+        assert storage.get_or_miss(backend_key, created_after=created_after) is MISSING
+        assert storage.get_or_miss(backend_key) == "backend"
+
+    def test_get_nonexistent(self, storage: TieredStorage):
+        with pytest.raises(MissingMemoError):
+            storage.get("nonexistent")
+
+    async def test_get_async_nonexistent(self, storage: TieredStorage):
+        with pytest.raises(MissingMemoError):
+            await storage.get_async("nonexistent")
+
+    def test_get_with_created_after(self, storage: TieredStorage, existing_key: str):
+        with pytest.raises(ExpiredMemoError):
+            storage.get(
+                existing_key,
+                created_after=datetime.now(timezone.utc) + timedelta(seconds=10),
+            )
+
+    def test_get_many_batches_backend_misses(
+        self, storage: TieredStorage, backend: FileStorage, existing_key: str
+    ):
+        backend.set("a", "1")
+        keys = [existing_key, "a", "nonexistent"]
+        with patch.object(backend, "get_many", wraps=backend.get_many) as get_many:
+            assert storage.get_many(keys) == ["test", "1", MISSING]
+        get_many.assert_called_once_with(["a", "nonexistent"], created_after=None)
+
+        # Memos read from the backend are copied into the in-process cache
+        with patch.object(backend, "get_many") as get_many:
+            assert storage.get_many([existing_key, "a"]) == ["test", "1"]
+        get_many.assert_not_called()
+
+    async def test_get_many_async_batches_backend_misses(
+        self, storage: TieredStorage, backend: FileStorage, existing_key: str
+    ):
+        await backend.set_many_async({"a": "1"})
+        with patch.object(
+            backend, "get_many_async", wraps=backend.get_many_async
+        ) as get_many_async:
+            assert await storage.get_many_async([existing_key, "a", "nonexistent"]) == [
+                "test",
+                "1",
+                MISSING,
+            ]
+            assert await storage.get_many_async([existing_key]) == ["test"]
+        get_many_async.assert_called_once_with(["a", "nonexistent"], created_after=None)
+
+    def test_set_many_writes_both_tiers(
+        self, storage: TieredStorage, backend: FileStorage
+    ):
+        with patch.object(backend, "set_many", wraps=backend.set_many) as set_many:
+            storage.set_many({"a": "1", "b": "2"})
+        set_many.assert_called_once_with({"a": "1", "b": "2"})
+        assert storage.l1.get_many(["a", "b"]) == ["1", "2"]
+
+    async def test_set_many_async_writes_both_tiers(
+        self, storage: TieredStorage, backend: FileStorage
+    ):
+        await storage.set_many_async({"a": "1", "b": "2"})
+        assert storage.l1.get_many(["a", "b"]) == ["1", "2"]
+        assert await backend.get_many_async(["a", "b"]) == ["1", "2"]
+
+    def test_in_process_cache_is_bounded(self, storage: TieredStorage):
+        storage.set("a", "1")
+        storage.set("b", "2")
+        storage.set("c", "3")
+
+        assert not storage.l1.exists("a")
+        assert storage.get("a") == "1"
+
+    def test_delete(self, storage: TieredStorage, existing_key: str):
+        storage.delete(existing_key)
+        assert not storage.exists(existing_key)
+
+    async def test_delete_async(self, storage: TieredStorage, existing_key: str):
+        await storage.delete_async(existing_key)
+        assert not await storage.exists_async(existing_key)